@@ -0,0 +1,52 @@
+#! /usr/bin/env python
+"""
+    Astronomia copyright 2013
+
+    This file is part of Astronomia.
+
+    Astronomia is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    Astronomia is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Astronomia; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+Compile the scalar coordinate kernels ahead of time with numba.pycc.
+
+Usage:
+
+    python devutils/build_aot_kernels.py
+
+Needs numba and a C compiler.  Writes the extension module _aot_kernels
+into src/astronomia, which astronomia._kernels picks up for scalar
+arguments.  Remove the module to go back to JIT compilation.
+"""
+
+import os
+
+from numba.pycc import CC
+
+from astronomia import _kernels
+
+cc = CC("_aot_kernels")
+cc.output_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "src", "astronomia"
+)
+
+_sig3 = "UniTuple(f8, 2)(f8, f8, f8)"
+_sig4 = "UniTuple(f8, 2)(f8, f8, f8, f8)"
+
+cc.export("ecl_to_equ_pre", _sig4)(_kernels.ecl_to_equ_pre.py_func)
+cc.export("ecl_to_equ", _sig3)(_kernels.ecl_to_equ.py_func)
+cc.export("equ_to_ecl", _sig3)(_kernels.equ_to_ecl.py_func)
+cc.export("equ_to_horiz", _sig4)(_kernels.equ_to_horiz.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -0,0 +1,69 @@
+#! /usr/bin/env python
+"""
+    Astronomia copyright 2013
+
+    This file is part of Astronomia.
+
+    Astronomia is free software; you can redistribute it and/or modify
+    it under the terms of the GNU General Public License as published by
+    the Free Software Foundation; either version 2 of the License, or
+    (at your option) any later version.
+
+    Astronomia is distributed in the hope that it will be useful,
+    but WITHOUT ANY WARRANTY; without even the implied warranty of
+    MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+    GNU General Public License for more details.
+
+    You should have received a copy of the GNU General Public License
+    along with Astronomia; if not, write to the Free Software
+    Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+Write the VSOP87d terms in vsop87d_dict.py out as NumPy tables.
+
+Usage:
+
+    python devutils/build_vsop_tables.py
+
+Writes vsop87d_terms.npy and vsop87d_index.npy into src/astronomia, which
+astronomia.planets memory maps instead of importing vsop87d_dict.py.  Run
+again whenever vsop87d_dict.py changes.
+
+vsop87d_terms.npy is a (3, N) array, the rows are the A, B and C of every
+term.  vsop87d_index.npy is an (8, 3, 7) array of offsets into it by planet
+(planet_names order), coordinate (coordinate_names order) and power of tau,
+series k running from offset k to offset k + 1.
+"""
+
+import os
+
+import numpy as np
+
+from astronomia.planets import coordinate_names, planet_names
+from astronomia.vsop87d_dict import _planets
+
+output_dir = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "src", "astronomia"
+)
+
+# series per coordinate, one for each power of tau
+npowers = 6
+
+terms = []
+index = np.zeros((len(planet_names), len(coordinate_names), npowers + 1), int)
+nterms = 0
+for i, planet in enumerate(planet_names):
+    for j, dim in enumerate(coordinate_names):
+        series = _planets[(planet, dim)]
+        for k in range(npowers):
+            index[i, j, k] = nterms
+            if k < len(series):
+                terms.extend(series[k])
+                nterms += len(series[k])
+        index[i, j, -1] = nterms
+
+if __name__ == "__main__":
+    np.save(
+        os.path.join(output_dir, "vsop87d_terms.npy"),
+        np.array(terms, dtype=np.float64).reshape(-1, 3).T.copy(),
+    )
+    np.save(os.path.join(output_dir, "vsop87d_index.npy"), index.astype(np.int64))
@@ -55,7 +55,7 @@ file as the value of "vsop87d_text_path".
 
 """
 
-import string
+import numpy as np
 
 #
 # Here are file format notes from the original VSOP distribution.
@@ -110,34 +110,43 @@ planets = (
 )
 coords = ("L", "B", "R")
 
+# Fixed column widths of a term record, split so that iv, ic, it, A, B and C
+# each land in their own field.
+_term_widths = (1, 1, 1, 1, 1, 74, 18, 14, 20)
+
 # each planet file...
 for planet in planets:
-    f = open(f"VSOP87D.{planet[:3].lower()}")
-    while s := f.readline():
-        if s[17] != "4":
+    # one read() per file, then work from the list of lines
+    with open(f"VSOP87D.{planet[:3].lower()}", "rb") as f:
+        lines = f.read().splitlines()
+    i = 0
+    while i < len(lines):
+        s = lines[i]
+        if s[17:18] != b"4":
             raise AssertionError
-        if (s[22:29]).rstrip() != planet.upper():
+        if s[22:29].decode().rstrip() != planet.upper():
             raise AssertionError
-        ic = int(s[41])  # coord type
-        it = int(s[59])  # time degree
+        ic = int(s[41:42])  # coord type
+        it = int(s[59:60])  # time degree
         nt = int(s[60:67])  # number of terms
         print(planet, coords[ic - 1], it, nt)
         # term records
-        for _ in range(nt):
-            s = f.readline()
-            if s[1] != "4":
-                raise AssertionError
-            ict = int(s[3])  # coord type
-            if ict != ic:
-                raise AssertionError
-            itt = int(s[4])  # time degree
-            if itt != it:
-                raise AssertionError
-            A = string.strip(s[79:97])
-            B = string.strip(s[97:111])
-            C = string.strip(s[111:131])
-            print(A, B, C)
-    f.close()
+        terms = np.genfromtxt(
+            lines[i + 1 : i + 1 + nt],
+            delimiter=_term_widths,
+            usecols=(1, 3, 4, 6, 7, 8),
+            dtype=np.float64,
+            ndmin=2,
+        )
+        i += 1 + nt
+        if np.any(terms[:, 0] != 4):
+            raise AssertionError
+        if np.any(terms[:, 1] != ic):  # coord type
+            raise AssertionError
+        if np.any(terms[:, 2] != it):  # time degree
+            raise AssertionError
+        for A, B, C in terms[:, 3:]:
+            print(f"{A:.11f} {B:.11f} {C:.11f}")
 #
 # that's all
 #
@@ -53,7 +53,8 @@ copyright = "2013, Tim Cera"
 # built documents.
 #
 # The short X.Y version.
-version = open("../VERSION").readline().strip()
+with open("../VERSION") as fp:
+    version = fp.readline().strip()
 # The full version, including alpha/beta/rc tags.
 release = version
 
@@ -0,0 +1,140 @@
+"""Copyright 2013 Astronomia by Tim Cera
+
+This file is part of Astronomia.
+
+Astronomia is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+Astronomia is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Astronomia; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+A small on-disk cache for the tables that seed the rise-set-transit
+calculations.
+
+The files are numpy .npz archives, written without pickles, under the user
+cache directory, from the optional platformdirs package or else
+~/.cache/astronomia.  Set the environment variable ASTRONOMIA_CACHE to use
+another directory, or to an empty string to turn the cache off.
+
+The files are kept apart by astronomia version, numpy major version, and a hash
+of the package's modules and data tables, so an editable install that changes
+the position code, or another environment sharing the directory, never reads
+stale tables.  Anything that goes wrong reading a file is a miss.
+"""
+
+import functools
+import hashlib
+import os
+from contextlib import suppress
+
+import numpy as np
+
+try:
+    import platformdirs
+except ImportError:
+    platformdirs = None
+
+
+@functools.lru_cache(maxsize=1)
+def _version():
+    try:
+        from importlib.metadata import PackageNotFoundError, version
+    except ImportError:
+        release = "dev"
+    else:
+        try:
+            release = version("astronomia")
+        except PackageNotFoundError:
+            release = "dev"
+
+    package = os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha1()
+    for root, dirs, files in os.walk(package):
+        dirs[:] = sorted(d for d in dirs if d not in ("__pycache__", "toolbox_utils"))
+        for fname in sorted(files):
+            if fname.endswith((".py", ".npy")):
+                path = os.path.join(root, fname)
+                digest.update(os.path.relpath(path, package).encode())
+                with open(path, "rb") as fp:
+                    digest.update(fp.read())
+
+    numpy_major = np.__version__.split(".")[0]
+    return f"{release}-numpy{numpy_major}-{digest.hexdigest()[:16]}"
+
+
+def cache_dir():
+    """Return the directory of this version's cache files, None if disabled."""
+    base = os.environ.get("ASTRONOMIA_CACHE")
+    if base is None:
+        if platformdirs is not None:
+            base = platformdirs.user_cache_dir("astronomia")
+        else:
+            base = os.path.join(os.path.expanduser("~"), ".cache", "astronomia")
+    if not base:
+        return None
+    return os.path.join(base, _version())
+
+
+def _seed_path(start_jd, kind):
+    directory = cache_dir()
+    if directory is None:
+        return None
+    return os.path.join(directory, f"rst_seed_{kind}_{float(start_jd)!r}.npz")
+
+
+def load_rst_seed(start_jd, kind="vsop"):
+    """Return the cached rise-set-transit seed tables, or None on a miss.
+
+    Arguments:
+      - `start_jd` : (float) Julian Day the tables were computed around
+
+    Keywords:
+      - `kind` : (str, default="vsop") Where the planet positions came from
+
+    Returns:
+      - the tables given to save_rst_seed, or None
+    """
+    path = _seed_path(start_jd, kind)
+    if path is None:
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            return tuple(data[f"arr_{i}"] for i in range(len(data.files)))
+    except Exception:
+        # unreadable, truncated, or from an incompatible numpy
+        return None
+
+
+def save_rst_seed(start_jd, tables, kind="vsop"):
+    """Write the rise-set-transit seed tables to the cache.
+
+    A cache directory that can't be written to is silently skipped.
+
+    Arguments:
+      - `start_jd` : (float) Julian Day the tables were computed around
+      - `tables` : (tuple) Arrays of numbers
+
+    Keywords:
+      - `kind` : (str, default="vsop") Where the planet positions came from
+    """
+    path = _seed_path(start_jd, kind)
+    if path is None:
+        return
+    tmp = f"{path}.{os.getpid()}"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "wb") as fp:
+            np.savez(fp, *[np.asarray(table) for table in tables])
+        # replace in one step so a concurrent reader never sees half a file
+        os.replace(tmp, path)
+    except OSError:
+        with suppress(OSError):
+            os.remove(tmp)
@@ -0,0 +1,428 @@
+"""Copyright 2013 Astronomia by Tim Cera
+
+This file is part of Astronomia.
+
+Astronomia is free software; you can redistribute it and/or modify
+it under the terms of the GNU General Public License as published by
+the Free Software Foundation; either version 2 of the License, or
+(at your option) any later version.
+
+Astronomia is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+GNU General Public License for more details.
+
+You should have received a copy of the GNU General Public License
+along with Astronomia; if not, write to the Free Software
+Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+
+Numerical kernels for the hot paths.
+
+If numba is installed the kernels are compiled with ``numba.njit``, otherwise
+they run as plain NumPy functions.  Either way they accept float scalars or
+float64 arrays.
+
+If devutils/build_aot_kernels.py has been run there is also an extension
+module, ``_aot_kernels``, with the scalar versions compiled ahead of time.
+All-scalar calls then go there and skip the JIT compile on first use.
+"""
+
+import numpy as np
+
+from .constants import pi2
+
+try:
+    from numba import njit
+
+    _have_numba = True
+except ImportError:
+    _have_numba = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+def as_float(x):
+    """Return a float for scalar input, else a float64 array.
+
+    The compiled kernels are specialized on argument type, so keep the
+    number of distinct types they see to a minimum.
+    """
+    if np.ndim(x) == 0:
+        return float(x)
+    return np.asarray(x, dtype=np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def ecl_to_equ_pre(longitude, latitude, cose, sine):
+    """Kernel for astronomia.coordinates._ecl_to_equ_pre."""
+    sinl = np.sin(longitude)
+    ra = np.arctan2(sinl * cose - np.tan(latitude) * sine, np.cos(longitude)) % pi2
+    dec = np.arcsin(np.sin(latitude) * cose + np.cos(latitude) * sine * sinl)
+    return ra, dec
+
+
+@njit(cache=True, fastmath=True)
+def ecl_to_equ(longitude, latitude, obliquity):
+    """Kernel for astronomia.coordinates.ecl_to_equ."""
+    return ecl_to_equ_pre(longitude, latitude, np.cos(obliquity), np.sin(obliquity))
+
+
+@njit(cache=True, fastmath=True)
+def equ_to_ecl(ra, dec, obliquity):
+    """Kernel for astronomia.coordinates.equ_to_ecl."""
+    cose = np.cos(obliquity)
+    sine = np.sin(obliquity)
+    sina = np.sin(ra)
+    longitude = np.arctan2(sina * cose + np.tan(dec) * sine, np.cos(ra)) % pi2
+    latitude = np.arcsin(np.sin(dec) * cose - np.cos(dec) * sine * sina) % pi2
+    return longitude, latitude
+
+
+@njit(cache=True, fastmath=True)
+def equ_to_horiz(H, decl, sinLat, cosLat):
+    """Kernel for astronomia.coordinates.equ_to_horiz."""
+    cosH = np.cos(H)
+    sind = np.sin(decl)
+    cosd = np.cos(decl)
+    A = np.arctan2(np.sin(H), cosH * sinLat - sind / cosd * cosLat)
+    h = np.arcsin(sinLat * sind + cosLat * cosd * cosH)
+    return A, h
+
+
+# the compiled kernels below need the jitted version, not the AOT dispatcher
+_equ_to_horiz = equ_to_horiz
+
+
+@njit(cache=True)
+def _diff_angle(a, b):
+    # same as astronomia.util.diff_angle, kept here so the RST kernels compile
+    result = b + pi2 - a if b < a else b - a
+    if result > np.pi:
+        result -= pi2
+    return result
+
+
+@njit(cache=True)
+def _interpolate3(n, y):
+    # astronomia.util.interpolate3 without the range check
+    a = y[1] - y[0]
+    b = y[2] - y[1]
+    c = b - a
+    return y[1] + n / 2 * (a + b + n * c)
+
+
+@njit(cache=True)
+def _interpolate_angle3(n, y):
+    # astronomia.util.interpolate_angle3 without the range check
+    a = _diff_angle(y[0], y[1])
+    b = _diff_angle(y[1], y[2])
+    c = _diff_angle(a, b)
+    return y[1] + n / 2 * (a + b + n * c)
+
+
+#
+# Status codes returned by the rise/set/transit kernels
+#
+RST_CONVERGED = 0
+RST_DROPPED = 1
+RST_BAILOUT = 2
+
+
+@njit(cache=True, fastmath=True)
+def riseset_iterate(
+    m, THETA0, k1, deltaT_days, raList, decList, h0, delta, longitude, sinLat, cosLat
+):
+    """Kernel for the refinement loop of astronomia.riseset._riseset.
+
+    `raList` and `decList` are length-3 float64 arrays, everything else is a
+    float.  Returns (m, status) where status is one of the RST_* codes.
+    """
+    for _ in range(20):
+        m0 = m
+        theta0 = (THETA0 + k1 * m) % pi2
+        n = m + deltaT_days
+        if not -1 < n < 1:
+            return m, RST_DROPPED
+        ra = _interpolate_angle3(n, raList)
+        dec = _interpolate3(n, decList)
+        H = _diff_angle(0.0, theta0 - longitude - ra)
+        _, h = _equ_to_horiz(H, dec, sinLat, cosLat)
+        dm = (h - h0) / (pi2 * np.cos(dec) * cosLat * np.sin(H))
+        m += dm
+        if abs(m - m0) < delta:
+            return m, RST_CONVERGED
+    return m, RST_BAILOUT
+
+
+@njit(cache=True, fastmath=True)
+def transit_iterate(m, THETA0, k1, deltaT_days, raList, delta, longitude):
+    """Kernel for the refinement loop of astronomia.riseset.transit.
+
+    `raList` is a length-3 float64 array, everything else is a float.
+    Returns (m, status) where status is one of the RST_* codes.
+    """
+    for _ in range(20):
+        m0 = m
+        theta0 = (THETA0 + k1 * m) % pi2
+        n = m + deltaT_days
+        if not -1 < n < 1:
+            return m, RST_DROPPED
+        ra = _interpolate_angle3(n, raList)
+        H = _diff_angle(0.0, theta0 - longitude - ra)
+        m += -H / pi2
+        if abs(m - m0) < delta:
+            return m, RST_CONVERGED
+    return m, RST_BAILOUT
+
+
+@njit(cache=True)
+def riseset_batch(
+    m, THETA0, k1, deltaT_days, raList, decList, h0, delta, longitude, sinLat, cosLat
+):
+    """Run riseset_iterate over each row of (N, 3) `raList` and `decList`.
+
+    `m`, `THETA0`, `deltaT_days` and `h0` are length-N float64 arrays, a NaN
+    in `m` marks a row with no event.  Returns length-N arrays of m and
+    status codes.
+    """
+    out = np.empty(m.shape[0])
+    status = np.empty(m.shape[0], dtype=np.int64)
+    for i in range(m.shape[0]):
+        if np.isnan(m[i]):
+            # checked here since the fastmath kernel may assume no NaNs
+            out[i], status[i] = m[i], RST_DROPPED
+            continue
+        out[i], status[i] = riseset_iterate(
+            m[i],
+            THETA0[i],
+            k1,
+            deltaT_days[i],
+            raList[i],
+            decList[i],
+            h0[i],
+            delta,
+            longitude,
+            sinLat,
+            cosLat,
+        )
+    return out, status
+
+
+@njit(cache=True)
+def transit_batch(m, THETA0, k1, deltaT_days, raList, delta, longitude):
+    """Run transit_iterate over each row of (N, 3) `raList`.
+
+    `m`, `THETA0` and `deltaT_days` are length-N float64 arrays.  Returns
+    length-N arrays of m and status codes.
+    """
+    out = np.empty(m.shape[0])
+    status = np.empty(m.shape[0], dtype=np.int64)
+    for i in range(m.shape[0]):
+        out[i], status[i] = transit_iterate(
+            m[i], THETA0[i], k1, deltaT_days[i], raList[i], delta, longitude
+        )
+    return out, status
+
+
+@njit(cache=True)
+def easter_julian(year):
+    """Kernel for astronomia.calendar.easter in the Julian calendar.
+
+    Returns 31 * month + day - 1 for an integer year or array of years.
+    """
+    a = year % 4
+    b = year % 7
+    c = year % 19
+    d = (19 * c + 15) % 30
+    e = (2 * a + 4 * b - d + 34) % 7
+    return d + e + 114
+
+
+@njit(cache=True)
+def easter_gregorian(year):
+    """Kernel for astronomia.calendar.easter in the Gregorian calendar.
+
+    Returns 31 * month + day - 1 for an integer year or array of years.
+    """
+    a = year % 19
+    b = year // 100
+    c = year % 100
+    d = b // 4
+    e = b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i = c // 4
+    k = c % 4
+    weekday = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * weekday) // 451
+    return h + weekday - 7 * m + 114
+
+
+if _have_numba:
+
+    @njit(cache=True, fastmath=True)
+    def vsop_series(A, B, C, tau):
+        """Sum A * cos(B + C * tau) over one VSOP87 series.
+
+        `A`, `B` and `C` are float64 arrays of the series terms and `tau` is
+        a 1-d float64 array of Julian millennia.  Returns one sum per `tau`.
+        """
+        out = np.zeros(tau.shape[0])
+        for j in range(tau.shape[0]):
+            t = tau[j]
+            total = 0.0
+            for i in range(A.shape[0]):
+                total += A[i] * np.cos(B[i] + C[i] * t)
+            out[j] = total
+        return out
+
+else:
+
+    def vsop_series(A, B, C, tau):
+        """Sum A * cos(B + C * tau) over one VSOP87 series.
+
+        `A`, `B` and `C` are float64 arrays of the series terms and `tau` is
+        a 1-d float64 array of Julian millennia.  Returns one sum per `tau`.
+        """
+        # element-wise loops are only fast when compiled, so broadcast
+        return A @ np.cos(B[:, np.newaxis] + C[:, np.newaxis] * tau)
+
+
+if _have_numba:
+
+    @njit(cache=True, fastmath=True)
+    def vsop_series_rows(A, B, C, offsets, rows, tau):
+        """Sum A * cos(B + C * tau) over one of several stacked series.
+
+        The terms of series k are A[offsets[k]:offsets[k + 1]], and so on.
+        For each tau[j] the sum is over series rows[j].  Returns one sum per
+        `tau`.
+        """
+        out = np.zeros(tau.shape[0])
+        for j in range(tau.shape[0]):
+            t = tau[j]
+            total = 0.0
+            for i in range(offsets[rows[j]], offsets[rows[j] + 1]):
+                total += A[i] * np.cos(B[i] + C[i] * t)
+            out[j] = total
+        return out
+
+else:
+
+    def vsop_series_rows(A, B, C, offsets, rows, tau):
+        """Sum A * cos(B + C * tau) over one of several stacked series.
+
+        The terms of series k are A[offsets[k]:offsets[k + 1]], and so on.
+        For each tau[j] the sum is over series rows[j].  Returns one sum per
+        `tau`.
+        """
+        out = np.zeros(tau.shape[0])
+        for k in np.unique(rows):
+            terms = slice(offsets[k], offsets[k + 1])
+            mask = rows == k
+            out[mask] = vsop_series(A[terms], B[terms], C[terms], tau[mask])
+        return out
+
+
+if _have_numba:
+
+    @njit(cache=True, fastmath=True)
+    def sincos(x):
+        """Return sin(x) and cos(x) of a float64 array.
+
+        Both are computed in the same loop, where LLVM turns the pair into one
+        sincos call that shares the range reduction.
+        """
+        flat = x.ravel()
+        sinx = np.empty(flat.size)
+        cosx = np.empty(flat.size)
+        for i in range(flat.size):
+            sinx[i] = np.sin(flat[i])
+            cosx[i] = np.cos(flat[i])
+        return sinx.reshape(x.shape), cosx.reshape(x.shape)
+
+else:
+
+    def sincos(x):
+        """Return sin(x) and cos(x) of a float64 array."""
+        return np.sin(x), np.cos(x)
+
+
+def _sincos_series_numpy(args, sin_coefs, cos_coefs, angles):
+    arg = args @ angles
+    if len(sin_coefs) and len(cos_coefs):
+        sinarg, cosarg = sincos(arg)
+        return sin_coefs @ sinarg, cos_coefs @ cosarg
+    sin_out = sin_coefs @ np.sin(arg) if len(sin_coefs) else None
+    cos_out = cos_coefs @ np.cos(arg) if len(cos_coefs) else None
+    return sin_out, cos_out
+
+
+@njit(cache=True, fastmath=True)
+def _sincos_series_loop(args, sin_coefs, cos_coefs, angles):
+    nsin = sin_coefs.shape[0]
+    ncos = cos_coefs.shape[0]
+    sin_out = np.zeros((nsin, angles.shape[1]))
+    cos_out = np.zeros((ncos, angles.shape[1]))
+    for j in range(angles.shape[1]):
+        for i in range(args.shape[0]):
+            arg = 0.0
+            for k in range(args.shape[1]):
+                arg += args[i, k] * angles[k, j]
+            if nsin:
+                sinarg = np.sin(arg)
+                for row in range(nsin):
+                    sin_out[row, j] += sin_coefs[row, i] * sinarg
+            if ncos:
+                cosarg = np.cos(arg)
+                for row in range(ncos):
+                    cos_out[row, j] += cos_coefs[row, i] * cosarg
+    return sin_out, cos_out
+
+
+# the compiled loop only beats NumPy's vectorized sin and cos for a few dates
+_sincos_loop_max = 4
+
+
+def sincos_series(args, sin_coefs, cos_coefs, angles):
+    """Sum the terms of a periodic series like ELP2000 or nutation.
+
+    `args` is an (N, K) float64 array with the multipliers of the K
+    fundamental `angles` for each of the N terms, and `angles` is (K, M) with
+    one column per date.  Each row of `sin_coefs` and of `cos_coefs` is N
+    coefficients.  Returns coefs @ sin(args @ angles) for `sin_coefs` and the
+    same with cos for `cos_coefs`.  Pass an empty (0, 0) array for
+    coefficients that aren't needed; the result for them is unused.
+    """
+    if _have_numba and angles.shape[1] <= _sincos_loop_max:
+        return _sincos_series_loop(args, sin_coefs, cos_coefs, angles)
+    return _sincos_series_numpy(args, sin_coefs, cos_coefs, angles)
+
+
+def _scalar_dispatch(aot, kernel):
+    """Send all-float calls to the ahead-of-time version of `kernel`."""
+
+    def dispatch(*args):
+        for arg in args:
+            if not isinstance(arg, float):
+                return kernel(*args)
+        return aot(*args)
+
+    dispatch.__doc__ = kernel.__doc__
+    return dispatch
+
+
+try:
+    from . import _aot_kernels
+except ImportError:
+    pass
+else:
+    ecl_to_equ_pre = _scalar_dispatch(_aot_kernels.ecl_to_equ_pre, ecl_to_equ_pre)
+    ecl_to_equ = _scalar_dispatch(_aot_kernels.ecl_to_equ, ecl_to_equ)
+    equ_to_ecl = _scalar_dispatch(_aot_kernels.equ_to_ecl, equ_to_ecl)
+    equ_to_horiz = _scalar_dispatch(_aot_kernels.equ_to_horiz, equ_to_horiz)
@@ -29,6 +29,8 @@ Usage:
 
 """
 
+import numpy as np
+
 from astronomia.calendar import cal_to_jd
 from astronomia.constants import km_per_au
 from astronomia.planets import VSOP87d
@@ -45,9 +47,10 @@ def main():
 
     days_per_hour = 1.0 / 24
 
-    for i in range(-24, 24):
-        jd = exact_jd + i * days_per_hour
-        R = vsop.dimension(jd, "Earth", "R")
+    # evaluate the whole +/- 24 hour sweep in one pass through the series
+    hours = np.arange(-24, 24)
+    Rs = vsop.dimension(exact_jd + hours * days_per_hour, "Earth", "R")
+    for i, R in zip(hours, Rs):
         print(i, (exact_r - R) * km_per_au)
 
 
@@ -21,12 +21,17 @@ along with Astronomia; if not, write to the Free Software
 Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 """
 
-from heapq import heappop, heappush
+import os
+import sys
+from heapq import heapify, heappop, heappush
+from itertools import count
 
 import cltoolbox
+import numpy as np
 from cltoolbox.rst_text_formatter import RSTHelpFormatter
 
 import astronomia.globals
+from astronomia._cache import load_rst_seed, save_rst_seed
 from astronomia.calendar import cal_to_jd, easter, lt_to_str, ut_to_lt
 from astronomia.constants import (
     days_per_minute,
@@ -34,14 +39,18 @@ from astronomia.constants import (
     standard_rst_altitude,
     sun_rst_altitude,
 )
-from astronomia.coordinates import ecl_to_equ
 from astronomia.dynamical import dt_to_ut
 from astronomia.equinox import equinox, equinox_approx
 from astronomia.lunar import Lunar
-from astronomia.nutation import nutation_in_longitude, nutation_in_obliquity, obliquity
-from astronomia.planets import VSOP87d, geocentric_planet, planet_names, vsop_to_fk5
+from astronomia.nutation import nutation_and_obliquity
+from astronomia.planets import (
+    VSOP87d,
+    geocentric_planet,
+    geocentric_planet_erfa,
+    planet_names,
+)
 from astronomia.riseset import moon_rst_altitude, rise, settime, transit
-from astronomia.sun import Sun, aberration_low
+from astronomia.sun import Sun
 from astronomia.util import load_params
 
 vsop = None  # delay loading this until we are sure the script can run
@@ -50,31 +59,86 @@ moon = Lunar()
 
 HIGH_PRIORITY = 0.0
 
-rstDict = {}
-
-
-class Task:
-    def __init__(self, jd, func, args):
-        self.jd = jd
-        self.func = func
-        self.args = args
+rst = None  # RSTBatch of everything with rise-set-transit events
 
-    def __cmp__(self, other):
-        return (self.jd > other.jd) - (self.jd < other.jd)
-
-    def __gt__(self, other):
-        return self.jd > other.jd
+rst_planets = [planet for planet in planet_names if planet != "Earth"]
+planets_from_erfa = False
 
 
+#
+# The task queue is a heap of (jd, seq, func, args) tuples.  seq comes from
+# taskSeq and breaks ties between equal Julian Days in the order queued, so
+# the functions themselves are never compared.
+#
 taskQueue = []
-
-
-class RiseSetTransit:
-    def __init__(self, name, raList, decList, h0List):
-        self.name = name
-        self.raList = raList
-        self.decList = decList
-        self.h0List = h0List
+taskSeq = count()
+
+
+#
+# In "fast" mode the display events are collected here, Julian Days and text
+# side by side, so the heap only holds the few tasks that schedule more events.
+# Once a simulated year they are put in order with one argsort and the ones no
+# pending task can come before are written out.
+#
+realtime_mode = False
+event_jds = []
+event_texts = []
+
+
+#
+# Rise-set-transit display lines, filled in with the local time string from
+# lt_to_str, the time zone and the name of the object.
+#
+_RISE_TMPL = "{time:<19} {zone} {name} rises".format
+_SET_TMPL = "{time:<19} {zone} {name} sets".format
+_TRANSIT_TMPL = "{time:<23} {name} transits".format
+
+# lines per sys.stdout.write when writing out the events of "fast" mode
+_write_lines = 4096
+
+
+def queue_display(jd, astr):
+    if realtime_mode:
+        heappush(taskQueue, (jd, next(taskSeq), display, (astr,)))
+    else:
+        event_jds.append(jd)
+        event_texts.append(astr)
+
+
+def write_events(before):
+    # write out, in order, the buffered events earlier than Julian Day before
+    jds = np.array(event_jds, dtype=np.float64)
+    order = np.argsort(jds, kind="stable")
+    ndone = int(np.searchsorted(jds[order], before))
+    done = order[:ndone].tolist()
+    write = sys.stdout.write
+    for first in range(0, ndone, _write_lines):
+        lines = [event_texts[i] for i in done[first : first + _write_lines]]
+        write("\n".join(lines) + "\n")
+
+    # keep the rest in the order they were queued, for the stable sort
+    keep = np.sort(order[ndone:]).tolist()
+    event_jds[:] = jds[keep].tolist()
+    event_texts[:] = [event_texts[i] for i in keep]
+
+
+class RSTBatch:
+    def __init__(self, names, raList, decList, h0List):
+        # one row per object of yesterday, today and tomorrow
+        self.names = list(names)
+        self.raList = np.array(raList, dtype=np.float64)
+        self.decList = np.array(decList, dtype=np.float64)
+        self.h0List = np.array(h0List, dtype=np.float64)
+
+    def push(self, ra, dec, h0):
+        # shift every row in place to drop the oldest day and add the newest
+        for values, value in (
+            (self.raList, ra),
+            (self.decList, dec),
+            (self.h0List, h0),
+        ):
+            values[:, :2] = values[:, 1:]
+            values[:, 2] = value
 
 
 def display(str):
@@ -85,9 +149,10 @@ def doEaster(year):
     month, day = easter(year)
     jd = cal_to_jd(year, month, day)
     astr = f"{lt_to_str(jd, None, 'day'):<24} Easter"
-    heappush(taskQueue, Task(jd, display, (astr,)))
+    queue_display(jd, astr)
     # recalculate on March 1, next year
-    heappush(taskQueue, Task(cal_to_jd(year + 1, 3, 1), doEaster, (year + 1,)))
+    jd = cal_to_jd(year + 1, 3, 1)
+    heappush(taskQueue, (jd, next(taskSeq), doEaster, (year + 1,)))
 
 
 _seasons = {
@@ -98,214 +163,162 @@ _seasons = {
 }
 
 
+# equinox_approx covers the years -1000 to 3000
+_last_equinox_year = 3000
+
+
 def doEquinox(year, season):
     approx_jd = equinox_approx(year, season)
     jd = equinox(approx_jd, season, days_per_second)
     ut = dt_to_ut(jd)
     lt, zone = ut_to_lt(ut)
     astr = f"{lt_to_str(lt, zone)} {_seasons[season]}"
-    heappush(taskQueue, Task(jd, display, (astr,)))
-    heappush(taskQueue, Task(jd, doEquinox, (year + 1, season)))
+    queue_display(jd, astr)
+    # the approximation, like doEquinoxes, stops at 3000
+    if year < _last_equinox_year:
+        heappush(taskQueue, (jd, next(taskSeq), doEquinox, (year + 1, season)))
+
+
+def doEquinoxes(start, stop):
+    # Every equinox and solstice from start to stop year, one season at a
+    # time as arrays.  The approximation only covers years up to 3000.
+    years = np.arange(start, min(stop, _last_equinox_year) + 1)
+    if len(years) == 0:
+        return
+    for season in astronomia.globals.season_names:
+        approx_jd = equinox_approx(years, season)
+        for jd in np.atleast_1d(equinox(approx_jd, season, days_per_second)):
+            ut = dt_to_ut(jd)
+            lt, zone = ut_to_lt(ut)
+            queue_display(jd, f"{lt_to_str(lt, zone)} {_seasons[season]}")
 
 
 def doRiseSetTransit(jd_today):
     #
-    # Find and queue rise-set-transit times for all objects
+    # Find and queue rise-set-transit times for all objects at once
     #
     jd = jd_today
-    for obj in list(rstDict.values()):
-        if td := rise(jd, obj.raList, obj.decList, obj.h0List[1], days_per_minute):
-            ut = dt_to_ut(td)
-            lt, zone = ut_to_lt(ut)
-            astr = f"{lt_to_str(lt, '', 'minute'):<19} {zone} {obj.name} rises"
-            heappush(taskQueue, Task(td, display, (astr,)))
+    raList = rst.raList
+    decList = rst.decList
+    h0 = rst.h0List[:, 1]
+    rises = rise(jd, raList, decList, h0, days_per_minute)
+    sets = settime(jd, raList, decList, h0, days_per_minute)
+    transits = transit(jd, raList, days_per_second)
+
+    # local names for the per-event calls
+    _isnan = np.isnan
+    _dt_to_ut = dt_to_ut
+    _ut_to_lt = ut_to_lt
+    _lt_to_str = lt_to_str
+    _queue_display = queue_display
+
+    for name, td_rise, td_set, td_transit in zip(
+        rst.names, rises.tolist(), sets.tolist(), transits.tolist()
+    ):
+        if not _isnan(td := td_rise):
+            lt, zone = _ut_to_lt(_dt_to_ut(td))
+            _queue_display(
+                td, _RISE_TMPL(time=_lt_to_str(lt, "", "minute"), zone=zone, name=name)
+            )
         else:
-            print("****** RiseSetTransit failure:", obj.name, "rise")
+            _queue_display(jd, f"****** RiseSetTransit failure: {name} rise")
 
-        if td := settime(jd, obj.raList, obj.decList, obj.h0List[1], days_per_minute):
-            ut = dt_to_ut(td)
-            lt, zone = ut_to_lt(ut)
-            astr = f"{lt_to_str(lt, '', 'minute'):<19} {zone} {obj.name} sets"
-            heappush(taskQueue, Task(td, display, (astr,)))
+        if not _isnan(td := td_set):
+            lt, zone = _ut_to_lt(_dt_to_ut(td))
+            _queue_display(
+                td, _SET_TMPL(time=_lt_to_str(lt, "", "minute"), zone=zone, name=name)
+            )
         else:
-            print("****** RiseSetTransit failure:", obj.name, "set")
+            _queue_display(jd, f"****** RiseSetTransit failure: {name} set")
 
-        if td := transit(jd, obj.raList, days_per_second):
-            ut = dt_to_ut(td)
-            lt, zone = ut_to_lt(ut)
-            astr = f"{lt_to_str(lt, zone):<23} {obj.name} transits"
-            heappush(taskQueue, Task(td, display, (astr,)))
+        if not _isnan(td := td_transit):
+            lt, zone = _ut_to_lt(_dt_to_ut(td))
+            _queue_display(td, _TRANSIT_TMPL(time=_lt_to_str(lt, zone), name=name))
         else:
-            print("****** RiseSetTransit failure:", obj.name, "transit")
+            _queue_display(jd, f"****** RiseSetTransit failure: {name} transit")
 
     #
     # setup the day after tomorrow
     #
     jd += 2
 
-    # nutation in longitude
-    deltaPsi = nutation_in_longitude(jd)
+    rst.push(*rst_positions(jd))
 
-    # apparent obliquity
-    eps = obliquity(jd) + nutation_in_obliquity(jd)
-
-    #
-    # Planets
-    #
-    for planet in planet_names:
-        if planet == "Earth":
-            continue
-        ra, dec = geocentric_planet(jd, planet, deltaPsi, eps, days_per_second)
-        obj = rstDict[planet]
-        del obj.raList[0]
-        del obj.decList[0]
-        del obj.h0List[0]
-        obj.raList.append(ra)
-        obj.decList.append(dec)
-        obj.h0List.append(standard_rst_altitude)
-    #
-    # Moon
-    #
-    lunar_longitude, lunar_latitude, lunar_radius = moon.dimension3(jd)
+    heappush(taskQueue, (jd, next(taskSeq), doRiseSetTransit, (jd_today + 1,)))
 
-    # nutation in longitude
-    lunar_longitude += deltaPsi
 
-    # equatorial coordinates
-    ra, dec = ecl_to_equ(lunar_longitude, lunar_latitude, eps)
+def rst_positions(jd):
+    # ra, dec and standard altitude of the planets, Moon and Sun, one row
+    # each, for a single Julian Day or an array of them
 
-    obj = rstDict["Moon"]
-    del obj.raList[0]
-    del obj.decList[0]
-    del obj.h0List[0]
-    obj.raList.append(ra)
-    obj.decList.append(dec)
-    obj.h0List.append(moon_rst_altitude(lunar_radius))
+    # nutation in longitude and apparent obliquity
+    deltaPsi, eps = nutation_and_obliquity(jd)
 
     #
-    # Sun
+    # Planets
     #
-    lunar_longitude, lunar_latitude, lunar_radius = sun.dimension3(jd)
-
-    # correct vsop coordinates
-    lunar_longitude, lunar_latitude = vsop_to_fk5(jd, lunar_longitude, lunar_latitude)
-
-    # nutation in longitude
-    lunar_longitude += deltaPsi
-
-    # aberration
-    lunar_longitude += aberration_low(lunar_radius)
-
-    # equatorial coordinates
-    ra, dec = ecl_to_equ(lunar_longitude, lunar_latitude, eps)
-
-    obj = rstDict["Sun"]
-    del obj.raList[0]
-    del obj.decList[0]
-    del obj.h0List[0]
-    obj.raList.append(ra)
-    obj.decList.append(dec)
-    obj.h0List.append(sun_rst_altitude)
-
-    heappush(taskQueue, Task(jd, doRiseSetTransit, (jd_today + 1,)))
+    if planets_from_erfa:
+        ra, dec = geocentric_planet_erfa(jd, rst_planets, days_per_second)
+    else:
+        ra, dec = geocentric_planet(jd, rst_planets, deltaPsi, eps, days_per_second)
+    h0 = np.full(ra.shape, standard_rst_altitude)
+
+    # Moon and Sun
+    moon_ra, moon_dec, moon_radius = moon.apparent_equatorial(jd, deltaPsi, eps)
+    sun_ra, sun_dec, _ = sun.apparent_equatorial(jd, deltaPsi, eps)
+
+    return (
+        np.concatenate([ra, [moon_ra, sun_ra]]),
+        np.concatenate([dec, [moon_dec, sun_dec]]),
+        np.concatenate(
+            [
+                h0,
+                [
+                    moon_rst_altitude(moon_radius),
+                    np.full(np.shape(sun_ra), sun_rst_altitude),
+                ],
+            ]
+        ),
+    )
 
 
 def initRST(start_year):
+    global rst
     start_jd = cal_to_jd(start_year)
 
     #
-    # We need nutation values for each of three days
+    # Yesterday, today, and tomorrow are evaluated together as arrays, or read
+    # back from the cache of an earlier run with the same start
     #
-    nutation = {}
-    for day in (-1, 0, 1):
-        jd = start_jd + day
-        # nutation in longitude
-        deltaPsi = nutation_in_longitude(jd)
-        # apparent obliquity
-        eps = obliquity(jd) + nutation_in_obliquity(jd)
-        nutation[day] = deltaPsi, eps
-
-    #
-    # Planets
-    #
-    for planet in planet_names:
-        if planet == "Earth":
-            continue
-        raList = []
-        decList = []
-        h0List = []
-        for day in (-1, 0, 1):
-            jd = start_jd + day
-            deltaPsi, eps = nutation[day]
-            ra, dec = geocentric_planet(jd, planet, deltaPsi, eps, days_per_second)
-            raList.append(ra)
-            decList.append(dec)
-            h0List.append(standard_rst_altitude)
-        rstDict[planet] = RiseSetTransit(planet, raList, decList, h0List)
-
-    #
-    # Moon
-    #
-    raList = []
-    decList = []
-    h0List = []
-    for day in (-1, 0, 1):
-        jd = start_jd + day
-        deltaPsi, eps = nutation[day]
-        sun_longitude, sun_latitude, sun_radius = moon.dimension3(jd)
-        # nutation in longitude
-        sun_longitude += deltaPsi
-        # equatorial coordinates
-        ra, dec = ecl_to_equ(sun_longitude, sun_latitude, eps)
-        raList.append(ra)
-        decList.append(dec)
-        h0List.append(moon_rst_altitude(sun_radius))
-    rstDict["Moon"] = RiseSetTransit("Moon", raList, decList, h0List)
-
-    #
-    # Sun
-    #
-    raList = []
-    decList = []
-    h0List = []
-    for day in (-1, 0, 1):
-        jd = start_jd + day
-        deltaPsi, eps = nutation[day]
-        sun_longitude, sun_latitude, sun_radius = sun.dimension3(jd)
-        # correct vsop coordinates
-        sun_longitude, sun_latitude = vsop_to_fk5(jd, sun_longitude, sun_latitude)
-        # nutation in longitude
-        sun_longitude += deltaPsi
-        # aberration
-        sun_longitude += aberration_low(sun_radius)
-        # equatorial coordinates
-        ra, dec = ecl_to_equ(sun_longitude, sun_latitude, eps)
-        raList.append(ra)
-        decList.append(dec)
-        h0List.append(sun_rst_altitude)
-    rstDict["Sun"] = RiseSetTransit("Sun", raList, decList, h0List)
+    kind = "erfa" if planets_from_erfa else "vsop"
+    tables = load_rst_seed(start_jd, kind)
+    if tables is None:
+        jd = start_jd + np.array([-1.0, 0.0, 1.0])
+        tables = rst_positions(jd)
+        save_rst_seed(start_jd, tables, kind)
+    rst = RSTBatch(rst_planets + ["Moon", "Sun"], *tables)
 
     # all Rise-Set-Transit events
-    heappush(taskQueue, Task(HIGH_PRIORITY, doRiseSetTransit, (start_jd,)))
+    heappush(taskQueue, (HIGH_PRIORITY, next(taskSeq), doRiseSetTransit, (start_jd,)))
 
 
 @cltoolbox.command(formatter_class=RSTHelpFormatter)
-def cronus(start, stop=None):
+def cronus(start, stop=None, realtime=False):
     """Displays a variety of celestial events in the order they occur.
 
     To do::
 
         -- Add many more events
-        -- Support both real-time and "fast" modes
         -- Allow finer start and stop times
 
-    Currently the program always runs in "fast" mode, queueing and
-    displaying events in the future as fast as possible. Eventually
-    I would like to have enough events covered so that the display
-    runs continuously even in real-time. Since the next event of
-    a given type needs to be calculated only when the previous one
-    has been delivered, this is not as computationally intense as it
-    sounds.
+    There are two modes.  The default "fast" mode calculates events as
+    fast as possible, collects them, and once a simulated year writes,
+    in order, the ones that no pending calculation can come before.
+    The --realtime mode puts every event on the task queue with the
+    calculations and displays each one as it comes off, so the next
+    event of a given type is calculated only when the previous one has
+    been delivered.  Eventually I would like to have enough events
+    covered so that the display runs continuously even in real-time.
 
     Parameters
     ----------
@@ -313,31 +326,70 @@ def cronus(start, stop=None):
         The year to start the display.
     stop : int, optional
         The year to stop the display. If not given, the display
-        continues until 10,000AD.
+        continues until 10,000AD.  Equinoxes and solstices are only
+        calculated up to the year 3000.
+    realtime : bool, optional
+        Queue every event on the task heap and display it as it comes
+        off.  The default collects the events and writes them out in
+        order a simulated year at a time.
+
+    Setting the environment variable ASTRONOMIA_PLANETS to "erfa" takes
+    the planet positions from the faster, lower precision ERFA routines in
+    the optional pyerfa package instead of VSOP87.
+
+    The positions that start the rise-set-transit calculations are cached
+    on disk by start year.  Set ASTRONOMIA_CACHE to another directory, or to
+    an empty string to turn the cache off.
     """
     global vsop
     global sun
+    global realtime_mode
+    global planets_from_erfa
+    realtime_mode = bool(realtime)
+    # start empty, even after an earlier run in the same process
+    taskQueue.clear()
+    event_jds.clear()
+    event_texts.clear()
+    planets_from_erfa = os.environ.get("ASTRONOMIA_PLANETS") == "erfa"
     start = int(start)
-    stop = cal_to_jd(stop) if stop is None else int(stop)
+    stop_year = 9999 if stop is None else int(stop)
+    stop = cal_to_jd(stop_year + 1)
     load_params()
     vsop = VSOP87d()
     sun = Sun()
 
     # Easter
-    heappush(taskQueue, Task(HIGH_PRIORITY, doEaster, (start,)))
+    tasks = [(HIGH_PRIORITY, next(taskSeq), doEaster, (start,))]
 
     # four equinox/solstice events
-    for season in astronomia.globals.season_names:
-        heappush(taskQueue, Task(HIGH_PRIORITY, doEquinox, (start, season)))
+    if realtime_mode:
+        for season in astronomia.globals.season_names:
+            tasks.append((HIGH_PRIORITY, next(taskSeq), doEquinox, (start, season)))
+    else:
+        doEquinoxes(start, stop_year)
+
+    taskQueue.extend(tasks)
+    heapify(taskQueue)
 
     # initialize rise-set-transit objects
     initRST(start)
 
     # start the task loop
-    t = heappop(taskQueue)
-    while t.jd < stop:
-        t.func(*t.args)
-        t = heappop(taskQueue)
+    pop = heappop
+    queue = taskQueue
+    flush_year = start + 1
+    flush_jd = cal_to_jd(flush_year)
+    jd, _, func, args = pop(queue)
+    while jd < stop:
+        if jd >= flush_jd:
+            # no task queues an event more than a day before its own time
+            write_events(jd - 1)
+            flush_year += 1
+            flush_jd = cal_to_jd(flush_year)
+        func(*args)
+        jd, _, func, args = pop(queue)
+
+    write_events(stop)
 
 
 def main():
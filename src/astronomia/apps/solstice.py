@@ -23,6 +23,7 @@ Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 """
 
 import cltoolbox
+import numpy as np
 from cltoolbox.rst_text_formatter import RSTHelpFormatter
 
 import astronomia.globals
@@ -52,11 +53,16 @@ def solstice(start, stop=None):
     stop = start if stop is None else int(stop)
     load_params()
 
-    for yr in range(start, stop + 1):
+    # every event of a season for the whole range of years at once
+    years = np.arange(start, stop + 1)
+    season_jds = [
+        np.atleast_1d(equinox(equinox_approx(years, season), season, days_per_second))
+        for season in astronomia.globals.season_names
+    ]
+
+    for yr, jds in zip(years.tolist(), zip(*season_jds)):
         print(yr)
-        for season in astronomia.globals.season_names:
-            approx_jd = equinox_approx(yr, season)
-            jd = equinox(approx_jd, season, days_per_second)
+        for season, jd in zip(astronomia.globals.season_names, jds):
             ut = dt_to_ut(jd)
             lt, zone = ut_to_lt(ut)
             print(tab, season, lt_to_str(lt, zone))
@@ -1,18 +1,20 @@
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import cltoolbox
-import pandas as pd
+import numpy as np
 from cltoolbox.rst_text_formatter import RSTHelpFormatter
 
-from .calendar import cal_to_jd
-from .constants import days_per_second
-from .coordinates import ecl_to_equ
+from . import _kernels
+from .constants import days_per_minute, days_per_second
 from .lunar import Lunar
-from .nutation import nutation_in_longitude, nutation_in_obliquity, obliquity
-from .planets import geocentric_planet, vsop_to_fk5
-from .sun import Sun, aberration_low
-from .toolbox_utils.src.toolbox_utils import tsutils
+from .nutation import nutation_and_obliquity
+from .planets import geocentric_planet
+from .riseset import _riseset, _transit
+from .sun import Sun
+from .util import d_to_r
 
 moon = Lunar()
 sun = Sun()
@@ -24,6 +26,9 @@ def right_ascension(
 ):
     """Print out right ascension.
 
+    The apparent geocentric right ascension, in degrees, so `latitude` and
+    `longitude` do not change the result.
+
     :param latitude <float>: The latitude of the location where you want to
         calculate right ascension.
     :param longitude <float>: The longitude of the location where you want to
@@ -41,12 +46,62 @@ def right_ascension(
         supplied also.  The pandas date offset code used to create the
         index.
     """
+    # pandas is slow to import, so only load it when a command needs it
+    import pandas as pd
+
     if input_ts is not None:
         start_date = input_ts.index[0]
         end_date = input_ts.index[-1]
     tindex = pd.date_range(start=start_date, end=end_date, freq=freq)
-    pd.DataFrame([0.0] * len(tindex), index=tindex)
-    # Finish!!!!!
+
+    # every date at once
+    ra, _ = _positions(np.asarray(tindex.to_julian_date()), body)
+    return pd.DataFrame(
+        {"right_ascension": np.degrees(ra)},
+        index=pd.DatetimeIndex(tindex, name="datetime"),
+    )
+
+
+#
+# Without numba the position series run as plain NumPy on one core.  Long date
+# ranges are then split across a process pool, shorter ones aren't worth the
+# cost of starting the workers.
+#
+_parallel_min_days = 2000
+
+
+def _positions(jd, body):
+    """_apparent_equatorial() for an array of `jd`, in parallel if it helps."""
+    workers = os.cpu_count() or 1
+    if _kernels._have_numba or workers < 2 or len(jd) < _parallel_min_days:
+        return _apparent_equatorial(jd, body)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = list(
+            executor.map(
+                _apparent_equatorial, np.array_split(jd, workers), repeat(body)
+            )
+        )
+    return tuple(
+        np.concatenate([np.atleast_1d(part) for part in parts])
+        for parts in zip(*results)
+    )
+
+
+def _apparent_equatorial(jd, body):
+    """Return apparent right ascension and declination of `body` at `jd`."""
+    body = body.capitalize()
+
+    # nutation in longitude and apparent obliquity
+    deltaPsi, eps = nutation_and_obliquity(jd)
+
+    if body == "Moon":
+        ra, dec, _ = moon.apparent_equatorial(jd, deltaPsi, eps)
+    elif body == "Sun":
+        ra, dec, _ = sun.apparent_equatorial(jd, deltaPsi, eps)
+    else:
+        ra, dec = geocentric_planet(jd, body, deltaPsi, eps, days_per_second)
+    return ra, dec
 
 
 @cltoolbox.command(formatter_class=RSTHelpFormatter)
@@ -80,47 +135,63 @@ def risesettransit(
 
         Defaults to "rise,set".
     """
+    import pandas as pd
+
+    from .toolbox_utils.src.toolbox_utils import tsutils
+
     start_date = tsutils.parsedate(start_date)
     end_date = tsutils.parsedate(end_date)
 
-    pd.date_range(start=start_date, end=end_date).to_julian_date()
-    start_jd = cal_to_jd(start_date)
+    dates = pd.date_range(start=start_date, end=end_date)
+    start_jd = dates.to_julian_date()[0]
+    ndays = len(dates)
 
     #
-    # We need nutation values for each of three days
+    # Every day needs yesterday, today, and tomorrow, so positions for the
+    # whole range plus one day either side are evaluated together as arrays
     #
-    nutation = {}
-    for day in (-1, 0, 1):
-        jd = start_jd + day
-        # nutation in longitude
-        deltaPsi = nutation_in_longitude(jd)
-        # apparent obliquity
-        eps = obliquity(jd) + nutation_in_obliquity(jd)
-        nutation[day] = deltaPsi, eps
-
-    for day in (-1, 0, 1):
-        jd = start_jd + day
-        deltaPsi, eps = nutation[day]
-        if body == "Moon":
-            moon_longitude, moon_latitude, moon_radius = moon.dimension3(jd)
-            # nutation in longitude
-            moon_longitude += deltaPsi
-            # equatorial coordinates
-            ra, dec = ecl_to_equ(moon_longitude, moon_latitude, eps)
-        elif body == "Sun":
-            moon_longitude, moon_latitude, moon_radius = sun.dimension3(jd)
-            # correct vsop coordinates
-            moon_longitude, moon_latitude = vsop_to_fk5(
-                jd, moon_longitude, moon_latitude
+    jd = start_jd + np.arange(-1.0, ndays + 1.0)
+
+    ra, dec = _positions(jd, body)
+
+    # The observer is passed to the solvers rather than set in astronomia.globals,
+    # which would change every later rise/settime/transit call in the process.
+    # astronomia measures longitude positive west of Greenwich.
+    latitude = d_to_r(float(latitude))
+    longitude = -d_to_r(float(longitude))
+    h0 = float(h0)
+
+    times = [i.strip() for i in times.split(",")]
+
+    # one (yesterday, today, tomorrow) row per day
+    today = jd[1:-1]
+    ra = np.ascontiguousarray(np.lib.stride_tricks.sliding_window_view(ra, 3))
+    dec = np.ascontiguousarray(np.lib.stride_tricks.sliding_window_view(dec, 3))
+
+    events = np.full((ndays, len(times)), np.nan)
+    for col, event in enumerate(times):
+        if event in ("rise", "set"):
+            events[:, col] = _riseset(
+                today, ra, dec, h0, days_per_minute, event, longitude, latitude
             )
-            # nutation in longitude
-            moon_longitude += deltaPsi
-            # aberration
-            moon_longitude += aberration_low(moon_radius)
-            # equatorial coordinates
-            ra, dec = ecl_to_equ(moon_longitude, moon_latitude, eps)
+        elif event == "transit":
+            events[:, col] = _transit(today, ra, days_per_second, longitude)
         else:
-            ra, dec = geocentric_planet(jd, body, deltaPsi, eps, days_per_second)
+            raise ValueError(f"""
+*
+*   The "times" keyword accepts "rise", "set", and "transit", but you gave
+*   {event}.
+*
+""")
+
+    # Days without an event are NaN; newer pandas keeps them through stack()
+    events = pd.DataFrame(events, columns=times).stack().dropna()
+    events = events.reset_index(level=1)
+    events.columns = ["event", "jd"]
+    events.index = pd.DatetimeIndex(
+        pd.to_datetime(events["jd"] - 2440587.5, unit="D"), name="datetime"
+    ).round("s")
+    return events.sort_index()
 
 
 def main():
@@ -38,12 +38,15 @@ Reference: Jean Meeus, *Astronomical Algorithms*, second edition, 1998,
 Willmann-Bell, Inc.
 """
 
-import datetime
+import bisect
+import collections
+import functools
 import time
 from math import modf
 
 import numpy as np
 
+from astronomia import _kernels
 from astronomia import globals as globls
 from astronomia.constants import minutes_per_day, seconds_per_day
 from astronomia.util import _scalar_if_one, d_to_r, modpi2
@@ -53,6 +56,18 @@ class Error(Exception):
     """local exception class."""
 
 
+#
+# A Julian Day held as whole days and the fraction of a day, so that the time
+# of day keeps full precision next to a day count of ~2.4e6.
+#
+SplitJD = collections.namedtuple("SplitJD", ["day", "frac"])
+
+#
+# Numbers that the scalar fast paths can work on without arrays
+#
+_scalar_types = (int, float, np.number)
+
+
 def frac_yr_to_jd(year, gregorian=True):
     """Convert a date in the Julian or Gregorian fractional year to the Julian
     Day Number (Meeus 7.1).
@@ -68,17 +83,18 @@ def frac_yr_to_jd(year, gregorian=True):
       - (float)
     """
     year = np.atleast_1d(year)
-    day = np.atleast_1d(0.0).astype(np.float64)
-    year, day = list(map(np.array, np.broadcast_arrays(year, day)))
     # For float years abuse the day variable
     fyear = year - year.astype("i")
     mask = fyear > 0
-    if np.any(mask):
-        year = year.astype("i")
-        days_in_year = cal_to_jd(year[mask] + 1) - cal_to_jd(year[mask])
-        day[mask] = days_in_year * fyear[mask]
-        return _scalar_if_one(cal_to_jd(year) + day)
-    return _scalar_if_one(cal_to_jd(year))
+    if not np.any(mask):
+        return _scalar_if_one(cal_to_jd(year))
+
+    year = year.astype("i")
+    jd = np.atleast_1d(cal_to_jd(year)).astype(np.float64)
+    # January 1 of the next year is always valid, so skip the checks
+    next_jd = _cal_to_jd(year[mask] + 1, 1, 1.0)
+    jd[mask] += (next_jd - jd[mask]) * fyear[mask]
+    return _scalar_if_one(jd)
 
 
 def yr_frac_mon_to_jd(year, mon, gregorian=True):
@@ -98,23 +114,21 @@ def yr_frac_mon_to_jd(year, mon, gregorian=True):
     """
     year = np.atleast_1d(year)
     mon = np.atleast_1d(mon).astype(np.float64)
-    day = np.atleast_1d(0.0).astype(np.float64)
-    year, mon, day = list(map(np.array, np.broadcast_arrays(year, mon, day)))
+    year, mon = np.broadcast_arrays(year, mon)
     fmon = mon - mon.astype("i")
     mask = fmon > 0
-    if np.any(mask):
-        mon = mon.astype("i")
-        next_mon = np.copy(mon) + 1
-        next_year = np.copy(year)
-        next_mon_mask = next_mon == 13
-        next_year[next_mon_mask] = next_year[next_mon_mask] + 1
-        next_mon[next_mon_mask] = 1
-        days_in_mon = cal_to_jd(next_year[mask], next_mon[mask]) - cal_to_jd(
-            year[mask], mon[mask]
-        )
-        day[mask] = days_in_mon * fmon[mask]
-        return _scalar_if_one(cal_to_jd(year, mon) + day)
-    return _scalar_if_one(cal_to_jd(year, mon))
+    if not np.any(mask):
+        return _scalar_if_one(cal_to_jd(year, mon))
+
+    mon = mon.astype("i")
+    jd = np.atleast_1d(cal_to_jd(year, mon)).astype(np.float64)
+    # the first of the next month is always valid, so skip the checks
+    december = mon[mask] == 12
+    next_jd = _cal_to_jd(
+        year[mask] + december, np.where(december, 1, mon[mask] + 1), 1.0
+    )
+    jd[mask] += (next_jd - jd[mask]) * fmon[mask]
+    return _scalar_if_one(jd)
 
 
 def cal_to_jd(year, mon=1, day=1, gregorian=True):
@@ -133,58 +147,119 @@ def cal_to_jd(year, mon=1, day=1, gregorian=True):
     Returns:
       - (int, float)
     """
+    if (
+        isinstance(year, _scalar_types)
+        and isinstance(mon, _scalar_types)
+        and isinstance(day, _scalar_types)
+    ):
+        return _cal_to_jd_scalar(year, mon, float(day), gregorian)
+
     year = np.atleast_1d(year)
     mon = np.atleast_1d(mon)
     day = np.atleast_1d(day).astype(np.float64)
 
-    _ = _extracted_from_cal_to_jd_21(
-        year, "Year must be integer. Use frac_yr_to_jd instead."
-    )
-    _ = _extracted_from_cal_to_jd_21(
-        mon, "Month must be integer. Use yr_frac_mon_to_jd instead."
-    )
+    _check_integral(year, "Year must be integer. Use frac_yr_to_jd instead.")
+    _check_integral(mon, "Month must be integer. Use yr_frac_mon_to_jd instead.")
     if np.any(mon > 12) or np.any(mon < 1):
         raise ValueError("Month must be from 1 to 12")
     if np.any(day > 31) or np.any(day < 1):
         raise ValueError("Day must be from 1 to 31")
-    year, mon, day = list(map(np.array, np.broadcast_arrays(year, mon, day)))
-
-    for thirtydays in (9, 4, 6, 11):
-        daytestarr = mon == thirtydays
-        if np.any(day[daytestarr] > 30):
-            raise ValueError("Day must be from 1 to 30")
+    # read-only views, nothing below writes to them
+    year, mon, day = np.broadcast_arrays(year, mon, day)
 
-    leapyeartest = np.atleast_1d(is_leap_year(year, gregorian))
+    if np.any((day > 30) & np.isin(mon, (9, 4, 6, 11))):
+        raise ValueError("Day must be from 1 to 30")
 
-    if np.any(np.logical_and(day[leapyeartest] > 29, mon[leapyeartest] == 2)):
-        raise ValueError("Day must be from 1 to 29")
-    if np.any(np.logical_and(day[~leapyeartest] > 28, mon[~leapyeartest] == 2)):
+    leap = _is_leap_year(year, gregorian)
+    bad = (mon == 2) & (day > np.where(leap, 29, 28))
+    if np.any(bad):
+        if np.any(bad & leap):
+            raise ValueError("Day must be from 1 to 29")
         raise ValueError("Day must be from 1 to 28")
 
-    testarr = mon <= 2
-    year[testarr] -= 1
-    mon[testarr] += 12
+    return _scalar_if_one(_cal_to_jd(year, mon, day, gregorian))
+
+
+def _cal_to_jd_scalar(year, mon, day, gregorian):
+    """cal_to_jd() for a single date, same checks and arithmetic, no arrays."""
+    if modf(year)[0] > 0:
+        raise ValueError("Year must be integer. Use frac_yr_to_jd instead.")
+    if modf(mon)[0] > 0:
+        raise ValueError("Month must be integer. Use yr_frac_mon_to_jd instead.")
+    if mon > 12 or mon < 1:
+        raise ValueError("Month must be from 1 to 12")
+    if day > 31 or day < 1:
+        raise ValueError("Day must be from 1 to 31")
+    mon = int(mon)
+    if mon in (9, 4, 6, 11) and day > 30:
+        raise ValueError("Day must be from 1 to 30")
+    if mon == 2:
+        iyear = int(year)
+        leap = iyear & 3 == 0
+        if gregorian:
+            leap = leap and (iyear % 100 != 0 or iyear % 400 == 0)
+        if leap and day > 29:
+            raise ValueError("Day must be from 1 to 29")
+        if not leap and day > 28:
+            raise ValueError("Day must be from 1 to 28")
+
+    if mon <= 2:
+        year = year - 1
+        mon = mon + 12
+    if gregorian:
+        A = int(year / 100)
+        B = 2 - A + int(A / 4)
+    else:
+        B = 0
+    return int(365.25 * (year + 4716)) + int(_month_days[mon - 3]) + day + B - 1524.5
+
+
+#
+# INT(30.6001 * (month + 1)) of Meeus 7.1 for months 3 to 14, after January
+# and February have been moved to the end of the previous year
+#
+_month_days = (30.6001 * np.arange(4, 16)).astype(np.int64)
+
+
+def _cal_to_jd(year, mon, day, gregorian=True):
+    """Meeus 7.1 on arrays, without any validation of the inputs.
+
+    Arguments:
+      - `year` : (array of int) year
+      - `mon`  : (array of int) month
+      - `day`  : (array of float) day, may be fractional day
+
+    Keywords:
+      - `gregorian` : (bool, default=True) If True, use Gregorian calendar,
+        else use Julian calendar
+
+    Returns:
+      - (array of float)
+    """
+    jan_feb = mon <= 2
+    year = np.where(jan_feb, year - 1, year)
+    mon = np.where(jan_feb, mon + 12, mon)
     if gregorian:
         A = (year / 100).astype(np.int64)
         B = 2 - A + (A / 4).astype(np.int64)
     else:
         B = 0
-    return _scalar_if_one(
+    return (
         (365.25 * (year + 4716)).astype(np.int64)
-        + (30.6001 * (mon + 1)).astype(np.int64)
+        + _month_days[np.asarray(mon, dtype=np.int64) - 3]
         + day
         + B
         - 1524.5
     )
 
 
-# TODO Rename this here and in `cal_to_jd`
-def _extracted_from_cal_to_jd_21(arg0, arg1):
-    fyear = arg0 - arg0.astype("i")
-    result = fyear > 0
-    if np.any(result):
-        raise ValueError(arg1)
-    return result
+def _check_integral(values, msg):
+    """Raise ValueError with `msg` if any of `values` has a fractional part."""
+    if values.dtype.kind in "biu":
+        # integer arrays can't have one
+        return
+    if np.any(np.modf(values)[0] > 0):
+        raise ValueError(msg)
 
 
 def jd_to_cal(julian_day, gregorian=True):
@@ -201,6 +276,9 @@ def jd_to_cal(julian_day, gregorian=True):
     Return:
       - (year, month, day) : (tuple) day may be fractional
     """
+    if isinstance(julian_day, _scalar_types):
+        return _jd_to_cal_scalar(float(julian_day), gregorian)
+
     julian_day = np.atleast_1d(julian_day)
     F, Z = np.modf(julian_day + 0.5)
     if gregorian:
@@ -213,13 +291,29 @@ def jd_to_cal(julian_day, gregorian=True):
     D = (365.25 * C).astype(np.int64)
     E = ((B - D) / 30.6001).astype(np.int64)
     day = B - D - (30.6001 * E).astype(np.int64) + F
-    mon = E - 13
-    mon[E < 14] = E[E < 14] - 1
-    year = C - 4715
-    year[mon > 2] = C[mon > 2] - 4716
+    mon = np.where(E < 14, E - 1, E - 13)
+    year = np.where(mon > 2, C - 4716, C - 4715)
     return _scalar_if_one(year), _scalar_if_one(mon), _scalar_if_one(day)
 
 
+def _jd_to_cal_scalar(julian_day, gregorian):
+    """jd_to_cal() for a single Julian Day, same arithmetic, no arrays."""
+    F, Z = modf(julian_day + 0.5)
+    if gregorian:
+        alpha = int((Z - 1867216.25) / 36524.25)
+        A = Z + 1 + alpha - int(alpha / 4)
+    else:
+        A = Z
+    B = A + 1524
+    C = int((B - 122.1) / 365.25)
+    D = int(365.25 * C)
+    E = int((B - D) / 30.6001)
+    day = B - D - int(30.6001 * E) + F
+    mon = E - 1 if E < 14 else E - 13
+    year = C - 4716 if mon > 2 else C - 4715
+    return year, mon, day
+
+
 def cal_to_jde(year, mon=1, day=1, hour=0, minute=0, sec=0.0, gregorian=True):
     """Convert a date in the Julian or Gregorian calendars to the Julian Day
     Ephemeris (Meeus 22.1).
@@ -263,9 +357,7 @@ def cal_to_day_of_year(year, mon, day, gregorian=True):
     mon = np.atleast_1d(mon).astype(np.int64)
     day = np.atleast_1d(day).astype(np.int64)
     year, mon, day = np.broadcast_arrays(year, mon, day)
-    K = np.ones_like(year)
-    K[:] = 2
-    K[np.atleast_1d(is_leap_year(year, gregorian))] = 1
+    K = np.where(_is_leap_year(year, gregorian), 1, 2)
     return _scalar_if_one(
         (275 * mon / 9.0).astype(np.int64)
         - (K * ((mon + 9) / 12.0).astype(np.int64))
@@ -292,9 +384,7 @@ def day_of_year_to_cal(year, N, gregorian=True):
     year = np.atleast_1d(year)
     N = np.atleast_1d(N)
     year, N = np.broadcast_arrays(year, N)
-    K = np.ones_like(N)
-    K[:] = 2
-    K[np.atleast_1d(is_leap_year(year, gregorian))] = 1
+    K = np.where(_is_leap_year(year, gregorian), 1, 2)
     mon = (9 * (K + N) / 275.0 + 0.98).astype(np.int64)
     mon[N < 32] = 1
     day = (
@@ -320,41 +410,44 @@ def easter(year, gregorian=True):
     Return:
       - (month, day) : (tuple)
     """
+    if np.ndim(year) == 0:
+        # compiled integer arithmetic, no arrays for a single year
+        if gregorian:
+            tmp = _kernels.easter_gregorian(int(year))
+        else:
+            tmp = _kernels.easter_julian(int(year))
+        mon, day = divmod(int(tmp), 31)
+        return mon, day + 1
     year = np.atleast_1d(year)
     if gregorian:
-        tmp = _extracted_from_easter_17(year)
+        tmp = _kernels.easter_gregorian(year)
     else:
-        tmp = _extracted_from_easter_31(year)
-    mon = tmp // 31
-    day = (tmp % 31) + 1
-    return _scalar_if_one(mon), _scalar_if_one(day)
+        tmp = _kernels.easter_julian(year)
+    mon, day = np.divmod(tmp, 31)
+    return _scalar_if_one(mon), _scalar_if_one(day + 1)
+
+
+def easter_range(start, stop, gregorian=True):
+    """Return the dates of Easter for every year from `start` to `stop`.
+
+    Arguments:
+      - `start` : (int) first year
+      - `stop` : (int) last year, included
 
+    Keywords:
+      - `gregorian` : (bool, default=True) If True, use Gregorian calendar,
+        else use Julian calendar
 
-# TODO Rename this here and in `easter`
-def _extracted_from_easter_31(year):
-    a = year % 4
-    b = year % 7
-    c = year % 19
-    d = (19 * c + 15) % 30
-    e = (2 * a + 4 * b - d + 34) % 7
-    return d + e + 114
-
-
-# TODO Rename this here and in `easter`
-def _extracted_from_easter_17(year):
-    a = year % 19
-    b = year // 100
-    c = year % 100
-    d = b // 4
-    e = b % 4
-    f = (b + 8) // 25
-    g = (b - f + 1) // 3
-    h = (19 * a + b - d - g + 15) % 30
-    i = c // 4
-    k = c % 4
-    weekday = (32 + 2 * e + 2 * i - h - k) % 7
-    m = (a + 11 * h + 22 * weekday) // 451
-    return h + weekday - 7 * m + 114
+    Return:
+      - (month, day) : (tuple) int64 arrays, one element per year
+    """
+    years = np.arange(start, stop + 1, dtype=np.int64)
+    if gregorian:
+        tmp = _kernels.easter_gregorian(years)
+    else:
+        tmp = _kernels.easter_julian(years)
+    mon, day = np.divmod(tmp, 31)
+    return mon, day + 1
 
 
 def fday_to_hms(day):
@@ -374,7 +467,7 @@ def fday_to_hms(day):
     minutes = int(seconds / 60.0)
     seconds = seconds - (minutes * 60.0)
     hours = int(minutes / 60.0)
-    minutes -= hours * 60.0
+    minutes -= hours * 60
     return hours, minutes, int(seconds)
 
 
@@ -389,6 +482,13 @@ def hms_to_fday(hr, mn, sec):
     Returns:
       - fractional day, 0.0..1.0
     """
+    if (
+        isinstance(hr, _scalar_types)
+        and isinstance(mn, _scalar_types)
+        and isinstance(sec, _scalar_types)
+    ):
+        # plain float arithmetic, no arrays for a single time
+        return hr / 24.0 + mn / minutes_per_day + sec / seconds_per_day
     hr = np.atleast_1d(hr)
     mn = np.atleast_1d(mn)
     sec = np.atleast_1d(sec)
@@ -403,19 +503,82 @@ def is_dst(julian_day):
     module.
 
     Arguments:
-      - `julian_day` : (int) Julian Day number representing an instant in
-        Universal Time
+      - `julian_day` : (int, float, or array) Julian Day number representing
+        an instant in Universal Time
 
     Returns:
       - (bool) True if Daylight Savings Time is in effect, False otherwise.
+        An array of them for array input.
     """
-    year, mon, day = jd_to_cal(julian_day)
-    day = int(day)
-    hr, minute, second = fday_to_hms(julian_day)
-    second = int(second)
+    if np.ndim(julian_day) == 0:
+        year = _civil_year(int(julian_day + 0.5))
+        dst_at_start, transitions = _dst_transitions(year)
+        stamp = (julian_day - _jd_unix_epoch) * seconds_per_day
+        return dst_at_start != (bisect.bisect_right(transitions, stamp) % 2 == 1)
+
+    julian_day = np.asarray(julian_day, dtype=np.float64)
+    years = np.asarray(jd_to_cal(julian_day)[0]).reshape(julian_day.shape)
+    stamps = (julian_day - _jd_unix_epoch) * seconds_per_day
+    dst = np.empty(julian_day.shape, dtype=bool)
+    # one transition table per year, the days of a year looked up together
+    for year in np.unique(years).tolist():
+        mask = years == year
+        dst_at_start, transitions = _dst_transitions(int(year))
+        crossed = np.searchsorted(transitions, stamps[mask], side="right")
+        dst[mask] = dst_at_start != (crossed % 2 == 1)
+    return dst
+
+
+#
+# Julian Day of the POSIX epoch, 1970-01-01 0h UT
+#
+_jd_unix_epoch = 2440587.5
+
 
-    stamp = datetime.datetime(year, mon, day, hr, minute, second)
-    return time.localtime(time.mktime(stamp.timetuple())).tm_isdst == 1
+@functools.lru_cache(maxsize=1024)
+def _civil_year(day):
+    """Return the year of the day starting at Julian Day `day` - 0.5."""
+    return int(jd_to_cal(day)[0])
+
+
+@functools.lru_cache(maxsize=256)
+def _dst_transitions(year):
+    """Return the DST state at the start of a year and its DST transitions.
+
+    The year is scanned a day at a time and each change is then narrowed down
+    to the second by bisection.
+
+    Arguments:
+      - `year` : (int) year, taken as starting at 0h UT on January 1
+
+    Returns:
+      - (bool) True if Daylight Savings Time is in effect at the start of the
+        year
+      - (tuple) POSIX timestamps of the instants where DST starts or stops
+    """
+
+    def dst_at(stamp):
+        return time.localtime(stamp).tm_isdst > 0
+
+    one_day = int(seconds_per_day)
+    start = int((cal_to_jd(year) - _jd_unix_epoch) * seconds_per_day)
+    stop = int((cal_to_jd(year + 1) - _jd_unix_epoch) * seconds_per_day)
+
+    dst_at_start = state = dst_at(start)
+    transitions = []
+    for hi in range(start + one_day, stop + 1, one_day):
+        if dst_at(hi) == state:
+            continue
+        lo = hi - one_day
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if dst_at(mid) == state:
+                lo = mid
+            else:
+                hi = mid
+        transitions.append(hi)
+        state = not state
+    return dst_at_start, tuple(transitions)
 
 
 def is_leap_year(year, gregorian=True):
@@ -431,16 +594,18 @@ def is_leap_year(year, gregorian=True):
     Returns:
       - (bool) True is this is a leap year, else False.
     """
-    year = np.atleast_1d(year).astype(np.int64)
-    x = np.fmod(year, 4)
+    return _scalar_if_one(_is_leap_year(year, gregorian))
+
+
+def _is_leap_year(year, gregorian=True):
+    """is_leap_year() that always returns a boolean array."""
+    # no copy for int64 input, the test below only reads the years
+    year = np.atleast_1d(year).astype(np.int64, copy=False)
+    # year & 3 is year mod 4, also for negative years
+    leap = (year & 3) == 0
     if gregorian:
-        x = np.fmod(year, 4)
-        y = np.fmod(year, 100)
-        z = np.fmod(year, 400)
-        return _scalar_if_one(
-            np.logical_and(np.logical_not(x), np.logical_or(y, np.logical_not(z)))
-        )
-    return _scalar_if_one(x == 0)
+        leap &= (year % 100 != 0) | (year % 400 == 0)
+    return leap
 
 
 def jd_to_day_of_week(julian_day):
@@ -449,29 +614,75 @@ def jd_to_day_of_week(julian_day):
     The Julian Day Number must be for 0h UT.
 
     Arguments:
-      - `julian_day` : (int) Julian Day number
+      - `julian_day` : (int, float, or array) Julian Day number
 
     Returns:
       - day of week : (int) 0 = Sunday...6 = Saturday.
     """
     julian_day = np.atleast_1d(julian_day)
+    # 0h UT is JD N.5, so the +1.5 makes the truncation land on N + 2.
     i = (julian_day + 1.5).astype(np.int64)
-    return _scalar_if_one(i % 7)
+    return _scalar_if_one(np.mod(i, 7))
 
 
 def jd_to_jcent(julian_day):
     """Return the number of Julian centuries since J2000.0.
 
     Arguments:
-      - `julian_day` : (int) Julian Day number
+      - `julian_day` : (int, float, or array) Julian Day number
 
     Return:
-      - Julian centuries : (int)
+      - Julian centuries : (float or array)
     """
+    # Called by nearly every series evaluation, so keep scalars off the
+    # array path.
+    if isinstance(julian_day, (int, float)):
+        return (julian_day - 2451545.0) / 36525.0
     julian_day = np.atleast_1d(julian_day)
     return _scalar_if_one((julian_day - 2451545.0) / 36525.0)
 
 
+def split_jd(julian_day):
+    """Split a Julian Day into whole days and the fraction of a day.
+
+    Arguments:
+      - `julian_day` : (float or array) Julian Day number
+
+    Returns:
+      - SplitJD(day, frac) : day is integral and 0 <= frac < 1 for
+        positive Julian Days
+    """
+    frac, day = np.modf(julian_day)
+    return SplitJD(day, frac)
+
+
+def to_jcent_split(day, frac):
+    """Return the number of Julian centuries since J2000.0.
+
+    Like jd_to_jcent(), but the whole days are referred to J2000.0 before the
+    fraction of the day is added, so no significance is lost.
+
+    Arguments:
+      - `day` : (float or array) whole days of the Julian Day number
+      - `frac` : (float or array) fraction of the day
+
+    Returns:
+      - Julian centuries : (float or array)
+    """
+    return ((day - 2451545.0) + frac) / 36525.0
+
+
+#
+# Time of day templates for lt_to_str, bound once here so a call only does
+# the substitution.
+#
+_lt_templates = {
+    "hour": "{0} {1:02d} {4}".format,
+    "minute": "{0} {1:02d}:{2:02d} {4}".format,
+    "second": "{0} {1:02d}:{2:02d}:{3:02d} {4}".format,
+}
+
+
 def lt_to_str(julian_day, zone="", level="second"):
     """Convert local time in Julian Days to a formatted string.
 
@@ -495,22 +706,17 @@ def lt_to_str(julian_day, zone="", level="second"):
     Return:
       - formatted date/time string : (str)
     """
+    if level != "day" and level not in _lt_templates:
+        raise Error(f"unknown time level = {level}")
+
     year, mon, day = jd_to_cal(julian_day)
     fday, iday = modf(day)
-    iday = int(iday)
-    hour, minute, sec = fday_to_hms(fday)
-    sec = int(sec)
-
-    if level == "second":
-        return f"{year}-{mon:02}-{iday:02} {hour:02}:{minute:02}:{sec:02} {zone}"
-    if level == "minute":
-        return f"{year}-{mon:02}-{iday:02} {hour:02}:{minute:02} {zone}"
-    if level == "hour":
-        return f"{year}-{mon:02}-{iday:02} {hour:02} {zone}"
+    date = f"{year}-{globls.month_names[mon - 1]}-{int(iday):02d}"
     if level == "day":
-        return f"{year}-{mon:02}-{iday:02}"
+        return date
 
-    raise Error(f"unknown time level = {level}")
+    hour, minute, sec = fday_to_hms(fday)
+    return _lt_templates[level](date, hour, minute, sec, zone)
 
 
 def sidereal_time_greenwich(julian_day):
@@ -519,22 +725,31 @@ def sidereal_time_greenwich(julian_day):
     The Julian Day number must represent Universal Time.
 
     Arguments:
-      - `julian_day` : (int) Julian Day number
+      - `julian_day` : (int, float, array, or SplitJD) Julian Day number
 
     Returns:
       - sidereal time in radians : (float) 2pi radians = 24 hours
     """
-    T = jd_to_jcent(julian_day)
-    T2 = T * T
-    T3 = T2 * T
+    if isinstance(julian_day, SplitJD):
+        day = np.asarray(julian_day.day, dtype=np.float64) - 2451545.0
+        frac = np.asarray(julian_day.frac, dtype=np.float64)
+        T = (day + frac) / 36525.0
+        # 360 * whole days is whole turns, so only the excess is kept
+        theta0 = (
+            280.46061837
+            + 0.98564736629 * day
+            + 360.98564736629 * frac
+            + T * T * (0.000387933 - T / 38710000)
+        )
+        return _scalar_if_one(modpi2(d_to_r(theta0)))
+    if not isinstance(julian_day, (int, float)):
+        julian_day = np.asarray(julian_day, dtype=np.float64)
+    days = julian_day - 2451545.0
+    T = days / 36525.0
     theta0 = (
-        280.46061837
-        + 360.98564736629 * (julian_day - 2451545.0)
-        + 0.000387933 * T2
-        - T3 / 38710000
+        280.46061837 + 360.98564736629 * days + T * T * (0.000387933 - T / 38710000)
     )
-    result = d_to_r(theta0)
-    return modpi2(result)
+    return modpi2(d_to_r(theta0))
 
 
 def ut_to_lt(julian_day):
@@ -543,12 +758,25 @@ def ut_to_lt(julian_day):
     Include Daylight Savings Time offset, if any.
 
     Arguments:
-      - `julian_day` : (int) Julian Day number, universal time
+      - `julian_day` : (int, float, or array) Julian Day number, universal
+        time
 
     Return:
       - Julian Day number : (str) local time
         zone string of the zone used for the conversion
+
+      For array input both are arrays, element by element.
     """
+    if np.ndim(julian_day) != 0:
+        dst = is_dst(julian_day)
+        offset = np.where(
+            dst, globls.daylight_timezone_offset, globls.standard_timezone_offset
+        )
+        zone = np.where(
+            dst, globls.daylight_timezone_name, globls.standard_timezone_name
+        )
+        return julian_day - offset, zone
+
     if is_dst(julian_day):
         zone = globls.daylight_timezone_name
         offset = globls.daylight_timezone_offset
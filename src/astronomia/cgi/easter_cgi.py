@@ -42,7 +42,7 @@ import time
 #
 sys.path.append("/home/groups/a/as/astronomia/lib/python")
 
-from astronomia.calendar import easter
+from astronomia.calendar import easter_range
 
 form = cgi.FieldStorage()
 
@@ -185,14 +185,16 @@ def display_results():
         print("<TH>Julian</TH>")
     print("</TR>")
 
-    for year in range(starting_year, ending_year + 1):
+    # every year of both calendars at once
+    years = range(starting_year, ending_year + 1)
+    gregorian = zip(*easter_range(starting_year, ending_year, True))
+    julian = zip(*easter_range(starting_year, ending_year, False))
+    for year, (g_month, g_day), (j_month, j_day) in zip(years, gregorian, julian):
         print("<TR>")
         if gregorian_calendar:
-            month, day = easter(year, True)
-            print("<TD><TT>{day:02}-{month:02}-{year:02}</TT></TD>")
+            print(f"<TD><TT>{g_day:02}-{g_month:02}-{year:02}</TT></TD>")
         if julian_calendar:
-            month, day = easter(year, False)
-            print("<TD><TT>{day:02}-{month:02}-{year:02}</TT></TD>")
+            print(f"<TD><TT>{j_day:02}-{j_month:02}-{year:02}</TT></TD>")
         print("</TR>")
     print("</TABLE>")
 
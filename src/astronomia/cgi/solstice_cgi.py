@@ -34,6 +34,8 @@ import cgi
 import sys
 import time
 
+import numpy as np
+
 #
 # Rather than setup PYTHONPATH in a shell script, we add it
 # through sys. That way we need only one file for the application.
@@ -326,11 +328,16 @@ def display_results():
     print("<TH>Winter Solstice</TH>")
     print("</TR>")
 
-    for year in range(starting_year, ending_year + 1):
+    # every event of a season for the whole range of years at once
+    years = np.arange(starting_year, ending_year + 1)
+    season_jds = [
+        np.atleast_1d(equinox(equinox_approx(years, season), season, days_per_second))
+        for season in astronomia.globals.season_names
+    ]
+
+    for jds in zip(*season_jds):
         print("<TR>")
-        for season in astronomia.globals.season_names:
-            approx_jd = equinox_approx(year, season)
-            jd = equinox(approx_jd, season, days_per_second)
+        for jd in jds:
             ut = dt_to_ut(jd)
             lt, zone = ut_to_lt(ut)
             print(f"<TD>{lt_to_str(lt, zone)}</TD>")
@@ -23,10 +23,14 @@ Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 Collection of miscellaneous functions
 """
 
+import functools
+
 import numpy as np
 
+from astronomia import _kernels
 from astronomia import globals as globls
-from astronomia.util import modpi2
+from astronomia._kernels import as_float
+from astronomia.constants import earth_equ_radius
 
 
 class Error(Exception):
@@ -47,12 +51,31 @@ def ecl_to_equ(longitude, latitude, obliquity):
       - Right accension in radians
       - Declination in radians
     """
-    cose = np.cos(obliquity)
-    sine = np.sin(obliquity)
-    sinl = np.sin(longitude)
-    ra = modpi2(np.arctan2(sinl * cose - np.tan(latitude) * sine, np.cos(longitude)))
-    dec = np.arcsin(np.sin(latitude) * cose + np.cos(latitude) * sine * sinl)
-    return ra, dec
+    return _kernels.ecl_to_equ(
+        as_float(longitude), as_float(latitude), as_float(obliquity)
+    )
+
+
+def _ecl_to_equ_pre(longitude, latitude, cose, sine):
+    """Convert ecliptic to equitorial coordinates.
+
+    Same as ecl_to_equ(), but takes the cosine and sine of the obliquity so
+    that callers converting many positions for one obliquity only compute
+    them once.
+
+    Arguments:
+      - `longitude` : ecliptic longitude in radians
+      - `latitude` : ecliptic latitude in radians
+      - `cose` : cosine of the obliquity of the ecliptic
+      - `sine` : sine of the obliquity of the ecliptic
+
+    Returns:
+      - Right accension in radians
+      - Declination in radians
+    """
+    return _kernels.ecl_to_equ_pre(
+        as_float(longitude), as_float(latitude), as_float(cose), as_float(sine)
+    )
 
 
 def equ_to_horiz(H, decl):
@@ -72,12 +95,26 @@ def equ_to_horiz(H, decl):
       - azimuth in radians
       - altitude in radians
     """
-    cosH = np.cos(H)
-    sinLat = np.sin(globls.latitude)
-    cosLat = np.cos(globls.latitude)
-    A = np.arctan2(np.sin(H), cosH * sinLat - np.tan(decl) * cosLat)
-    h = np.arcsin(sinLat * np.sin(decl) + cosLat * np.cos(decl) * cosH)
-    return A, h
+    sinLat, cosLat = _latitude_sincos(float(globls.latitude))
+    return _kernels.equ_to_horiz(as_float(H), as_float(decl), sinLat, cosLat)
+
+
+@functools.lru_cache(maxsize=16)
+def _latitude_sincos(latitude):
+    """Return sine and cosine of the observer latitude.
+
+    The latitude rarely changes, but globals.latitude can be assigned
+    directly, so the cache is keyed on its value.
+    """
+    return float(np.sin(latitude)), float(np.cos(latitude))
+
+
+#
+# Constant terms for ell_to_geo
+#
+_f = 1.0 / 298.2564219846
+_ea = earth_equ_radius / 1000
+_ee = 2.0 * _f - _f * _f
 
 
 def ell_to_geo(latitude, longitude, height):
@@ -93,22 +130,15 @@ def ell_to_geo(latitude, longitude, height):
       - theta
       - phi
     """
-    from .constants import earth_equ_radius
-
-    f = 1.0 / 298.2564219846
-    ea = earth_equ_radius / 1000
-
-    ee = 2.0 * f - f * f
-
     sinLat = np.sin(latitude)
     cosLat = np.cos(latitude)
 
-    N = ea / np.sqrt(1.0 - ee * sinLat * sinLat)
+    N = _ea / np.sqrt(1.0 - _ee * sinLat * sinLat)
 
     Hx = (N + height) * cosLat
-    Hy = (N * (1 - ee) + height) * sinLat
+    Hy = (N * (1 - _ee) + height) * sinLat
 
-    r = np.sqrt(Hx * Hx + Hy * Hy)
+    r = np.hypot(Hx, Hy)
     theta = np.arctan2(Hx, Hy)
     phi = longitude
 
@@ -129,9 +159,4 @@ def equ_to_ecl(ra, dec, obliquity):
       - ecliptic longitude in radians
       - ecliptic latitude in radians
     """
-    cose = np.cos(obliquity)
-    sine = np.sin(obliquity)
-    sina = np.sin(ra)
-    longitude = modpi2(np.arctan2(sina * cose + np.tan(dec) * sine, np.cos(ra)))
-    latitude = modpi2(np.arcsin(np.sin(dec) * cose - np.cos(dec) * sine * sina))
-    return longitude, latitude
+    return _kernels.equ_to_ecl(as_float(ra), as_float(dec), as_float(obliquity))
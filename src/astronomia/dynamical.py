@@ -27,6 +27,7 @@ Reference: Jean Meeus, *Astronomical Algorithms*, second edition, 1998,
 Willmann-Bell, Inc.
 """
 
+import functools
 from bisect import bisect
 from contextlib import suppress
 
@@ -1313,13 +1314,29 @@ def deltaT_seconds(jd):
     return result
 
 
+#
+# deltaT changes by well under a millisecond a day, so dt_to_ut() caches it
+# in one minute steps.
+#
+_cache_steps_per_day = 1440
+
+
+@functools.lru_cache(maxsize=8192)
+def _deltaT_days(step):
+    """Cached deltaT in days for dt_to_ut(), keyed on an integer minute step."""
+    return deltaT_seconds(step / _cache_steps_per_day) / seconds_per_day
+
+
 def dt_to_ut(jd):
     """Convert Julian Day from dynamical to universal time.
 
+    deltaT is cached with `jd` rounded to the nearest minute, which changes
+    the result by microseconds at most.
+
     Arguments:
       - `jd` : (int) Julian Day number (dynamical time)
 
     Returns:
       - Julian Day number : (int) (universal time)
     """
-    return jd - deltaT_seconds(jd) / seconds_per_day
+    return jd - _deltaT_days(int(round(jd * _cache_steps_per_day)))
@@ -23,7 +23,9 @@ Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 Calculate the times of solstice and equinox events for Earth
 """
 
-from math import cos, pi
+from math import pi
+
+import numpy as np
 
 from . import globals as globls
 from .calendar import jd_to_jcent
@@ -31,7 +33,7 @@ from .constants import pi2
 from .nutation import nutation_in_longitude
 from .planets import vsop_to_fk5
 from .sun import Sun, aberration_low
-from .util import d_to_r, diff_angle, polynomial
+from .util import _scalar_if_one, d_to_r, polynomial
 
 
 class Error(Exception):
@@ -98,33 +100,31 @@ def equinox_approx(yr, season):
     the error from the precise instant is at most 2.16 minutes.
 
     Arguments:
-      - `yr`     : (int) year
+      - `yr`     : (int or array) year
       - `season` : (str) {"spring", "summer", "autumn", "winter"}
 
     Returns:
-      - Julian Day : (int) in dynamical time
+      - Julian Day : (float or array) in dynamical time
     """
-    if not -1000 <= yr <= 3000:
+    yr = np.atleast_1d(yr).astype(np.int64)
+    if np.any((yr < -1000) | (yr > 3000)):
         raise Error("year is out of range")
     if season not in globls.season_names:
         raise Error(f"unknown season ={season}")
 
-    yr = int(yr)
-    if -1000 <= yr <= 1000:
-        Y = yr / 1000.0
-        tbl = _approx_1000
-    else:
-        Y = (yr - 2000) / 1000.0
-        tbl = _approx_3000
-
-    jd = polynomial(tbl[season], Y)
+    early = yr <= 1000
+    jd = np.where(
+        early,
+        polynomial(_approx_1000[season], yr / 1000.0),
+        polynomial(_approx_3000[season], (yr - 2000) / 1000.0),
+    )
     T = jd_to_jcent(jd)
     W = d_to_r(35999.373 * T - 2.47)
-    delta_lambda = 1 + 0.0334 * cos(W) + 0.0007 * cos(2 * W)
+    delta_lambda = 1 + 0.0334 * np.cos(W) + 0.0007 * np.cos(2 * W)
 
-    jd += 0.00001 * sum(A * cos(B + C * T) for A, B, C in _terms) / delta_lambda
+    jd += 0.00001 * sum(A * np.cos(B + C * T) for A, B, C in _terms) / delta_lambda
 
-    return jd
+    return _scalar_if_one(jd)
 
 
 _circle = {"spring": 0.0, "summer": pi * 0.5, "autumn": pi, "winter": pi * 1.5}
@@ -136,13 +136,14 @@ def equinox(jd, season, delta):
     """Return the precise moment of an equinox or solstice event on Earth.
 
     Parameters:
-      - `jd`     : Julian of an approximate time of the event in dynamical time
+      - `jd`     : Julian of an approximate time of the event in dynamical
+        time, or an array of them for the same season
       - `season` : one of ("spring", "summer", "autumn", "winter")
       - `delta`  : the required precision in days. Times accurate to a second
         are reasonable when using the VSOP model.
 
     Returns:
-      - Julian Day : (int) dynamical time
+      - Julian Day : (float or array) dynamical time
     """
     #
     # If we knew that the starting approximate time was close enough
@@ -151,13 +152,22 @@ def equinox(jd, season, delta):
     #
     circ = _circle[season]
     sun = Sun()
+    jd = np.atleast_1d(jd).astype(np.float64)
+    # Each event stops iterating as soon as it has converged, so an array
+    # gives the same answers as one event at a time.
+    active = np.arange(jd.size)
     for _ in range(20):
-        jd0 = jd
-        L, B, R = sun.dimension3(jd)
-        L += nutation_in_longitude(jd) + aberration_low(R)
-        L, B = vsop_to_fk5(jd, L, B)
+        ja = jd[active]
+        L, B, R = sun.dimension3(ja)
+        L = L + nutation_in_longitude(ja) + aberration_low(R)
+        L, B = vsop_to_fk5(ja, L, B)
+        # circ - L wrapped to -pi..pi, as util.diff_angle(L, circ)
+        diff = (circ - L) % pi2
+        diff = np.where(diff > np.pi, diff - pi2, diff)
         # Meeus uses jd + 58 * sin(diff(...))
-        jd += diff_angle(L, circ) * _k_sun_motion
-        if abs(jd - jd0) < delta:
-            return jd
+        step = np.atleast_1d(diff * _k_sun_motion)
+        jd[active] = ja + step
+        active = active[~(np.abs(step) < delta)]
+        if active.size == 0:
+            return _scalar_if_one(jd)
     raise Error("bailout")
@@ -29,10 +29,15 @@ This is the simplified version of Jean Meeus, *Astronomical Algorithms*,
 second edition, 1998, Willmann-Bell, Inc.
 """
 
+import functools
+
 import numpy as np
 
+from . import _kernels
 from .calendar import jd_to_jcent
 from .commonterms import kD, kF, kL1, kM, kM1, ko
+from .coordinates import ecl_to_equ
+from .nutation import nutation_in_longitude
 from .util import d_to_r, modpi2, polynomial
 
 
@@ -177,6 +182,26 @@ _tblB = (
     (2, -2, 0, 1, 107),
 )
 
+#
+# The tables above as arrays for _kernels.sincos_series.  The multipliers of D,
+# M, M1 and F of each term are one row.  The coefficients are split into three
+# rows by the power of E they take, which depends on the multiplier of M.
+#
+
+
+def _split_by_E(table, column):
+    table = np.array(table, dtype=np.float64)
+    absM = np.abs(table[:, 1])
+    return np.stack([table[:, column] * (absM == power) for power in (0, 1, 2)])
+
+
+_LR_args = np.ascontiguousarray(np.array(_tblLR, dtype=np.float64)[:, :4])
+_LR_l = _split_by_E(_tblLR, 4)
+_LR_r = _split_by_E(_tblLR, 5)
+_B_args = np.ascontiguousarray(np.array(_tblB, dtype=np.float64)[:, :4])
+_B_b = _split_by_E(_tblB, 4)
+_no_coefs = np.empty((0, 0))
+
 _kA1 = (d_to_r(119.75), d_to_r(131.849))
 _kA2 = (d_to_r(53.09), d_to_r(479264.290))
 _kA3 = (d_to_r(313.45), d_to_r(481266.484))
@@ -184,6 +209,14 @@ _kA3 = (d_to_r(313.45), d_to_r(481266.484))
 
 def _constants(T):
     """Calculate values required by several other functions."""
+    # dimension() asks for the same date once per dimension
+    if isinstance(T, float):
+        return _constants_cached(T)
+    return _constants_uncached(T)
+
+
+def _constants_uncached(T):
+    """_constants() without the cache, for arrays."""
     L1 = modpi2(polynomial(kL1, T))
     D = modpi2(polynomial(kD, T))
     M = modpi2(polynomial(kM, T))
@@ -200,6 +233,20 @@ def _constants(T):
     return L1, D, M, M1, F, A1, A2, A3, E, E2
 
 
+_constants_cached = functools.lru_cache(maxsize=128)(_constants_uncached)
+
+
+def _angles(D, M, M1, F):
+    """Return the fundamental arguments with one column per date."""
+    return np.stack((D, M, M1, F)).reshape(4, -1)
+
+
+def _series_sum(terms, E, E2):
+    """Add up the three rows of a series from sincos_series with E applied."""
+    plain, times_E, times_E2 = terms.reshape((3,) + np.shape(E))
+    return plain + E * times_E + E2 * times_E2
+
+
 class Lunar:
     """ELP2000 lunar position calculations."""
 
@@ -325,7 +372,33 @@ class Lunar:
           - latitude in radians
           - radius in km, Earth's center to Moon's center
         """
-        return self._longitude(jd), self._latitude(jd), self._radius(jd)
+        constants = _constants(jd_to_jcent(jd))
+        D, M, M1, F = constants[1:5]
+        lterms, rterms = _kernels.sincos_series(
+            _LR_args, _LR_l, _LR_r, _angles(D, M, M1, F)
+        )
+        return (
+            self._longitude(jd, constants, lterms),
+            self._latitude(jd, constants),
+            self._radius(jd, constants, rterms),
+        )
+
+    def apparent_equatorial(self, jd, deltaPsi, epsilon):
+        """Return apparent right ascension, declination and radius.
+
+        Arguments:
+          - `jd`       : Julian Day in dynamical time
+          - `deltaPsi` : nutation in longitude, in radians
+          - `epsilon`  : True obliquity (corrected for nutation), in radians
+
+        Returns:
+          - right ascension in radians
+          - declination in radians
+          - radius in km, Earth's center to Moon's center
+        """
+        L, B, R = self.dimension3(jd)
+        ra, dec = ecl_to_equ(L + deltaPsi, B, epsilon)
+        return ra, dec, R
 
     def dimension(self, jd, dim):
         """Return one of geocentric ecliptic longitude, latitude and radius.
@@ -346,39 +419,37 @@ class Lunar:
             return self._radius(jd)
         raise Error(f"unknown dimension = {dim}")
 
-    def _longitude(self, jd):
-        """Return the geocentric ecliptic longitude in radians."""
-        from .nutation import nutation_in_longitude
+    def _longitude(self, jd, constants=None, terms=None):
+        """Return the geocentric ecliptic longitude in radians.
 
-        T = jd_to_jcent(jd)
-        L1, D, M, M1, F, A1, A2, A3, E, E2 = _constants(T)
-        lsum = 0.0
-        for tD, tM, tM1, tF, tl, tr in _tblLR:
-            arg = tD * D + tM * M + tM1 * M1 + tF * F
-            if abs(tM) == 1:
-                tl *= E
-            elif abs(tM) == 2:
-                tl *= E2
-            lsum += tl * np.sin(arg)
+        dimension3 passes in `constants` from _constants and `terms`, the
+        sums of table 47.A, so the longitude and radius series are
+        evaluated together once for all three dimensions.
+        """
+        if constants is None:
+            constants = _constants(jd_to_jcent(jd))
+        L1, D, M, M1, F, A1, A2, _, E, E2 = constants
+        if terms is None:
+            terms, _ = _kernels.sincos_series(
+                _LR_args, _LR_l, _no_coefs, _angles(D, M, M1, F)
+            )
+        lsum = _series_sum(terms, E, E2)
 
         lsum += 3958 * np.sin(A1) + 1962 * np.sin(L1 - F) + 318 * np.sin(A2)
 
         nutinlong = nutation_in_longitude(jd)
         return L1 + d_to_r(lsum / 1000000) + nutinlong
 
-    def _latitude(self, jd):
+    def _latitude(self, jd, constants=None):
         """Return the geocentric ecliptic latitude in radians."""
-        T = jd_to_jcent(jd)
-        L1, D, M, M1, F, A1, A2, A3, E, E2 = _constants(T)
+        if constants is None:
+            constants = _constants(jd_to_jcent(jd))
+        L1, D, M, M1, F, A1, _, A3, E, E2 = constants
 
-        bsum = 0.0
-        for tD, tM, tM1, tF, tb in _tblB:
-            arg = tD * D + tM * M + tM1 * M1 + tF * F
-            if abs(tM) == 1:
-                tb *= E
-            elif abs(tM) == 2:
-                tb *= E2
-            bsum += tb * np.sin(arg)
+        terms, _ = _kernels.sincos_series(
+            _B_args, _B_b, _no_coefs, _angles(D, M, M1, F)
+        )
+        bsum = _series_sum(terms, E, E2)
 
         bsum += (
             -2235 * np.sin(L1)
@@ -391,18 +462,16 @@ class Lunar:
 
         return d_to_r(bsum / 1000000)
 
-    def _radius(self, jd):
+    def _radius(self, jd, constants=None, terms=None):
         """Return the geocentric radius in km."""
-        T = jd_to_jcent(jd)
-        L1, D, M, M1, F, A1, A2, A3, E, E2 = _constants(T)
-
-        rsum = 0.0
-        for tD, tM, tM1, tF, tl, tr in _tblLR:
-            arg = tD * D + tM * M + tM1 * M1 + tF * F
-            if abs(tM) == 1:
-                tr *= E
-            elif abs(tM) == 2:
-                tr *= E2
-            rsum += tr * np.cos(arg)
+        if constants is None:
+            constants = _constants(jd_to_jcent(jd))
+        _, D, M, M1, F, _, _, _, E, E2 = constants
+        if terms is None:
+            _, terms = _kernels.sincos_series(
+                _LR_args, _no_coefs, _LR_r, _angles(D, M, M1, F)
+            )
+
+        rsum = _series_sum(terms, E, E2)
 
         return 385000.56 + rsum / 1000
@@ -34,11 +34,14 @@ published in *Explanatory Supplement to the Astronomical Almanac*, revised
 edition edited by P. Kenneth Seidelman, 1992
 """
 
+import functools
+
 import numpy as np
 
+from . import _kernels
 from .calendar import jd_to_jcent
 from .commonterms import kD, kF, kM, kM1, ko
-from .util import d_to_r, dms_to_d, modpi2, polynomial
+from .util import _scalar_if_one, d_to_r, dms_to_d, modpi2, polynomial
 
 # [Meeus-1998: table 22.A]
 #
@@ -111,9 +114,32 @@ _tbl = (
 )
 
 
+#
+# The table above as arrays for _kernels.sincos_series.  The multipliers of D,
+# M, M1, F and omega of each term are one row.  The coefficients are a constant
+# row and a row that is multiplied by T, scaled from 0.0001" and 0.00001" units
+# to radians.
+#
+_tbl_arr = np.array(_tbl, dtype=np.float64)
+_args = np.ascontiguousarray(_tbl_arr[:, :5])
+_psi_coefs = np.stack((_tbl_arr[:, 5] / 10000.0, _tbl_arr[:, 6] / 100000.0))
+_psi_coefs = d_to_r(_psi_coefs / 3600)
+_eps_coefs = np.stack((_tbl_arr[:, 7] / 10000.0, _tbl_arr[:, 8] / 100000.0))
+_eps_coefs = d_to_r(_eps_coefs / 3600)
+_no_coefs = np.empty((0, 0))
+
+
 def _constants(T):
     """Return some values needed for both nutation_in_longitude() and
     nutation_in_obliquity()"""
+    # the two are usually called one after the other for the same date
+    if isinstance(T, float):
+        return _constants_cached(T)
+    return _constants_uncached(T)
+
+
+def _constants_uncached(T):
+    """_constants() without the cache, for arrays."""
     D = modpi2(polynomial(kD, T))
     M = modpi2(polynomial(kM, T))
     M1 = modpi2(polynomial(kM1, T))
@@ -122,6 +148,9 @@ def _constants(T):
     return D, M, M1, F, omega
 
 
+_constants_cached = functools.lru_cache(maxsize=128)(_constants_uncached)
+
+
 def nutation_in_longitude(jd):
     """Return the nutation in longitude.
 
@@ -133,20 +162,13 @@ def nutation_in_longitude(jd):
     Returns:
       - nutation in longitude, in radians
     """
-    #
-    # Future optimization: factor the /1e5 and /1e6 adjustments into the table.
-    #
-    # Could turn the loop into a generator expression. Too messy?
-    #
     T = jd_to_jcent(jd)
     D, M, M1, F, omega = _constants(T)
-    deltaPsi = 0.0
-    for tD, tM, tM1, tF, tomega, tpsiK, tpsiT, tepsK, tepsT in _tbl:
-        arg = D * tD + M * tM + M1 * tM1 + F * tF + omega * tomega
-        deltaPsi += (tpsiK / 10000.0 + tpsiT / 100000.0 * T) * np.sin(arg)
-
-    deltaPsi /= 3600
-    return d_to_r(deltaPsi)
+    terms, _ = _kernels.sincos_series(
+        _args, _psi_coefs, _no_coefs, np.stack((D, M, M1, F, omega)).reshape(5, -1)
+    )
+    constant, times_T = terms.reshape((2,) + np.shape(T))
+    return constant + times_T * T
 
 
 def nutation_in_obliquity(jd):
@@ -160,19 +182,75 @@ def nutation_in_obliquity(jd):
     Returns:
       - nutation in obliquity, in radians
     """
-    #
-    # Future optimization: factor the /1e5 and /1e6 adjustments into the table.
-    #
-    # Could turn the loop into a generator expression. Too messy?
-    #
     T = jd_to_jcent(jd)
     D, M, M1, F, omega = _constants(T)
-    deltaEps = 0.0
-    for tD, tM, tM1, tF, tomega, tpsiK, tpsiT, tepsK, tepsT in _tbl:
-        arg = D * tD + M * tM + M1 * tM1 + F * tF + omega * tomega
-        deltaEps = deltaEps + (tepsK / 10000.0 + tepsT / 100000.0 * T) * np.cos(arg)
-    deltaEps = deltaEps / 3600
-    return d_to_r(deltaEps)
+    _, terms = _kernels.sincos_series(
+        _args, _no_coefs, _eps_coefs, np.stack((D, M, M1, F, omega)).reshape(5, -1)
+    )
+    constant, times_T = terms.reshape((2,) + np.shape(T))
+    return constant + times_T * T
+
+
+def nutation(jd):
+    """Return the nutation in longitude and in obliquity.
+
+    High precision. [Meeus-1998: pg 144]  Same as nutation_in_longitude()
+    and nutation_in_obliquity(), but the two share one pass over the table.
+
+    Arguments:
+      - `jd` : Julian Day in dynamical time
+
+    Returns:
+      - nutation in longitude, in radians
+      - nutation in obliquity, in radians
+    """
+    T = jd_to_jcent(jd)
+    D, M, M1, F, omega = _constants(T)
+    psi_terms, eps_terms = _kernels.sincos_series(
+        _args, _psi_coefs, _eps_coefs, np.stack((D, M, M1, F, omega)).reshape(5, -1)
+    )
+    psi_constant, psi_times_T = psi_terms.reshape((2,) + np.shape(T))
+    eps_constant, eps_times_T = eps_terms.reshape((2,) + np.shape(T))
+    return psi_constant + psi_times_T * T, eps_constant + eps_times_T * T
+
+
+#
+# Constant terms
+#
+_kL = (d_to_r(280.4665), d_to_r(36000.7698))
+_kL1 = (d_to_r(218.3165), d_to_r(481267.8813))
+
+
+def nutation_low(jd):
+    """Return the nutation in longitude and in obliquity.
+
+    Low precision, from the four largest periodic terms. [Meeus-1998: pg
+    144]. Accuracy is 0.5" in longitude and 0.1" in obliquity.
+
+    Arguments:
+      - `jd` : Julian Day in dynamical time
+
+    Returns:
+      - nutation in longitude, in radians
+      - nutation in obliquity, in radians
+    """
+    T = jd_to_jcent(jd)
+    omega = modpi2(polynomial(ko, T))
+    L2 = 2 * polynomial(_kL, T)
+    L12 = 2 * polynomial(_kL1, T)
+    deltaPsi = (
+        -17.20 * np.sin(omega)
+        - 1.32 * np.sin(L2)
+        - 0.23 * np.sin(L12)
+        + 0.21 * np.sin(2 * omega)
+    )
+    deltaEps = (
+        9.20 * np.cos(omega)
+        + 0.57 * np.cos(L2)
+        + 0.10 * np.cos(L12)
+        - 0.09 * np.cos(2 * omega)
+    )
+    return d_to_r(deltaPsi / 3600), d_to_r(deltaEps / 3600)
 
 
 #
@@ -236,3 +314,44 @@ def obliquity_hi(jd):
     """
     U = jd_to_jcent(jd) / 100
     return polynomial(_el1, U)
+
+
+#
+# Nutation and obliquity change slowly, so the cache works in 15 minute steps.
+#
+_cache_steps_per_day = 96
+
+
+@functools.lru_cache(maxsize=4096)
+def _nutation_and_obliquity(step):
+    """Cached worker for nutation_and_obliquity(), keyed on an integer step."""
+    jd = step / _cache_steps_per_day
+    deltaPsi, deltaEps = nutation(jd)
+    return deltaPsi, obliquity(jd) + deltaEps
+
+
+def nutation_and_obliquity(jd):
+    """Return the nutation in longitude and the apparent obliquity.
+
+    The values are cached with `jd` rounded to the nearest 15 minutes, which
+    changes the results by well under a milliarcsecond.  Intended for callers
+    such as the rise-set-transit code that ask for the same days repeatedly;
+    consecutive yesterday/today/tomorrow windows only compute one new day.
+
+    Arguments:
+      - `jd` : Julian Day in dynamical time
+
+    Returns:
+      - nutation in longitude, in radians
+      - obliquity corrected for nutation, in radians
+    """
+    steps = np.rint(np.atleast_1d(jd) * _cache_steps_per_day).astype(np.int64)
+    deltaPsi, eps = np.array(
+        [_nutation_and_obliquity(step) for step in steps.tolist()]
+    ).T
+    return _scalar_if_one(deltaPsi), _scalar_if_one(eps)
+
+
+def clear_cache():
+    """Empty the nutation_and_obliquity() cache."""
+    _nutation_and_obliquity.cache_clear()
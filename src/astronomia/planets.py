@@ -23,12 +23,22 @@ Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
 The VSOP87d planetary position model
 """
 
+import functools
+import math
+import os
+
 import numpy as np
 
+try:
+    import erfa
+except ImportError:
+    erfa = None
+
+from . import _kernels
 from .calendar import jd_to_jcent
 from .constants import pi2
 from .coordinates import ecl_to_equ
-from .util import _scalar_if_one, d_to_r, diff_angle, dms_to_d, modpi2, polynomial
+from .util import _scalar_if_one, d_to_r, dms_to_d, modpi2, polynomial
 
 
 class Error(Exception):
@@ -52,16 +62,58 @@ planet_names = (
 )
 coordinate_names = ("L", "B", "R")
 
-#
-# Local dictionary of planetary terms.
-#
-# The key is a tuple (planet_name, coordinate_name)
-#
-# The value of each entry is a list of lists.
-#
-_planets = {}
 
-_first_time = True
+def _load_tables():
+    """Return the planetary terms from devutils/build_vsop_tables.py tables.
+
+    The tables are memory mapped, which is much quicker than importing
+    vsop87d_dict.py.  Returns None if they are not there.
+    """
+    here = os.path.dirname(__file__)
+    try:
+        terms = np.load(os.path.join(here, "vsop87d_terms.npy"), mmap_mode="r")
+        index = np.load(os.path.join(here, "vsop87d_index.npy"))
+    except OSError:
+        return None
+
+    # plain ndarray views of the map, the compiled kernels don't take memmaps
+    A, B, C = (np.asarray(row) for row in terms)
+    planets = {}
+    for i, planet in enumerate(planet_names):
+        for j, dim in enumerate(coordinate_names):
+            offsets = index[i, j]
+            planets[(planet, dim)] = [
+                (A[start:stop], B[start:stop], C[start:stop])
+                for start, stop in zip(offsets[:-1], offsets[1:])
+                if stop > start
+            ]
+    return planets
+
+
+@functools.lru_cache(maxsize=None)
+def _load_planets():
+    """Return the dictionary of planetary terms, loaded on the first call.
+
+    The key is a tuple (planet_name, coordinate_name).
+
+    The value of each entry is a list, one item per power of tau, of (A, B, C)
+    tuples of contiguous float64 arrays.
+    """
+    planets = _load_tables()
+    if planets is None:
+        from .vsop87d_dict import _planets as terms
+
+        planets = {
+            key: [
+                tuple(
+                    np.ascontiguousarray(i)
+                    for i in np.array(s, dtype=np.float64).reshape(-1, 3).T
+                )
+                for s in series
+            ]
+            for key, series in terms.items()
+        }
+    return planets
 
 
 class VSOP87d:
@@ -76,15 +128,7 @@ class VSOP87d:
 
         This is actually done only once to save time and space.
         """
-        global _first_time
-
-        if not _first_time:
-            return
-
-        global _planets
-        from .vsop87d_dict import _planets
-
-        _first_time = False
+        _load_planets()
 
     def dimension(self, jd, planet, dim):
         """Return one of heliocentric ecliptic longitude, latitude and radius.
@@ -102,15 +146,13 @@ class VSOP87d:
           - longitude in radians, or latitude in radians, or radius in au,
             depending on the value of `dim`.
         """
-        jd = np.atleast_1d(jd)
-        X = 0.0
-        tauN = 1.0
-        tau = jd_to_jcent(jd) / 10.0
-        c = _planets[(planet, dim)]
+        return self._dimension(_vsop_time_args(jd), planet, dim)
 
-        for s in c:
-            X += np.sum([A * np.cos(B + C * tau) for A, B, C in s]) * tauN
-            tauN = tauN * tau  # last calculation is wasted
+    def _dimension(self, time_args, planet, dim):
+        """dimension() with the powers of tau from _vsop_time_args()."""
+        X = 0.0
+        for (A, B, C), tauN in zip(_load_planets()[(planet, dim)], time_args):
+            X += _kernels.vsop_series(A, B, C, time_args[1]) * tauN
 
         if dim == "L":
             X = modpi2(X)
@@ -130,11 +172,103 @@ class VSOP87d:
           - latitude in radians
           - radius in au
         """
-        L = self.dimension(jd, planet, "L")
-        B = self.dimension(jd, planet, "B")
-        R = self.dimension(jd, planet, "R")
+        return self._dimension3(_vsop_time_args(jd), planet)
+
+    def _dimension3(self, time_args, planet):
+        """dimension3() with the powers of tau from _vsop_time_args()."""
+        L = self._dimension(time_args, planet, "L")
+        B = self._dimension(time_args, planet, "B")
+        R = self._dimension(time_args, planet, "R")
         return L, B, R
 
+    def dimension3_all(self, jd, planets=planet_names):
+        """Return heliocentric ecliptic longitude, latitude and radius.
+
+        Same as dimension3(), but for several planets at once.
+
+        Arguments:
+          - `jd`      : Julian Day in dynamical time
+          - `planets` : a sequence of planet names, by default all of them
+
+        Returns:
+          - longitude in radians
+          - latitude in radians
+          - radius in au
+
+          Each with one row per planet.
+        """
+        planets = tuple(planets)
+        shape = (len(planets),) + np.shape(jd)
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64)).ravel()
+        rows = np.repeat(np.arange(len(planets)), jd.size)
+        time_args = _vsop_time_args(np.tile(jd, len(planets)))
+        return tuple(
+            X.reshape(shape) for X in self._dimension3_rows(planets, rows, time_args)
+        )
+
+    def _dimension3_rows(self, planets, rows, time_args):
+        """dimension3() where element j is for planet planets[rows[j]]."""
+        return tuple(
+            self._dimension_rows(planets, rows, time_args, dim)
+            for dim in coordinate_names
+        )
+
+    def _dimension_rows(self, planets, rows, time_args, dim):
+        """dimension() where element j is for planet planets[rows[j]]."""
+        X = 0.0
+        for (A, B, C, offsets), tauN in zip(_stacked_series(planets, dim), time_args):
+            X += _kernels.vsop_series_rows(A, B, C, offsets, rows, time_args[1]) * tauN
+
+        if dim == "L":
+            X = modpi2(X)
+
+        return X
+
+
+#
+# Series of several planets stacked end to end for vsop_series_rows().
+#
+# The key is a tuple (planet_names, coordinate_name), the value a list, one
+# item per power of tau, of (A, B, C, offsets) tuples.
+#
+_stacked = {}
+
+
+def _stacked_series(planets, dim):
+    """Return the series of `planets` for `dim`, stacked one power at a time.
+
+    Planets with fewer powers of tau get empty series for the rest.
+    """
+    key = (planets, dim)
+    if key not in _stacked:
+        empty = (np.empty(0),) * 3
+        terms = _load_planets()
+        per_planet = [terms[(planet, dim)] for planet in planets]
+        stacked = []
+        for power in range(max(len(series) for series in per_planet)):
+            terms = [
+                series[power] if power < len(series) else empty for series in per_planet
+            ]
+            offsets = np.cumsum([0] + [len(A) for A, _, _ in terms])
+            stacked.append(tuple(np.concatenate(x) for x in zip(*terms)) + (offsets,))
+        _stacked[key] = stacked
+    return _stacked[key]
+
+
+def _vsop_time_args(jd):
+    """Return the powers of tau, in Julian millennia, used by every series.
+
+    All planets and all three dimensions evaluate their series at the same
+    tau, so work out tau**0 through tau**5 once and share them.
+    """
+    tau = np.atleast_1d(jd_to_jcent(np.asarray(jd, dtype=np.float64)) / 10.0)
+    tauN = 1.0
+    time_args = []
+    for _ in range(6):
+        time_args.append(tauN)
+        tauN = tauN * tau
+    return time_args
+
 
 #
 # Constant terms
@@ -160,9 +294,19 @@ def vsop_to_fk5(jd, L, B):
       - corrected longitude in radians
       - corrected latitude in radians
     """
+    if isinstance(jd, float) and isinstance(L, float) and isinstance(B, float):
+        # one date at a time, as from Sun and the equinox search, is cheaper
+        # with math than with 1-element arrays
+        L1 = L + polynomial((0.0, _k0, _k1), jd_to_jcent(jd))
+        cosL1 = math.cos(L1)
+        sinL1 = math.sin(L1)
+        deltaL = _k2 + _k3 * (cosL1 + sinL1) * math.tan(B)
+        deltaB = _k3 * (cosL1 - sinL1)
+        return (L + deltaL) % pi2, B + deltaB
+
     jd = np.atleast_1d(jd)
     T = jd_to_jcent(jd)
-    L1 = polynomial([L, _k0, _k1], T)
+    L1 = L + polynomial((0.0, _k0, _k1), T)
     cosL1 = np.cos(L1)
     sinL1 = np.sin(L1)
     deltaL = _k2 + _k3 * (cosL1 + sinL1) * np.tan(B)
@@ -179,7 +323,7 @@ def geocentric_planet(jd, planet, deltaPsi, epsilon, delta):
     Arguments:
       - `jd`       : Julian Day in dynamical time
       - `planet`   : must be one of ("Mercury", "Venus", "Earth", "Mars",
-        "Jupiter", "Saturn", "Uranus", "Neptune")
+        "Jupiter", "Saturn", "Uranus", "Neptune"), or a sequence of them
       - `deltaPsi` : nutation in longitude, in radians
       - `epsilon`  : True obliquity (corrected for nutation), in radians
       - `delta`    : desired accuracy, in days
@@ -187,21 +331,47 @@ def geocentric_planet(jd, planet, deltaPsi, epsilon, delta):
     Returns:
       - right accension, in radians
       - declination, in radians
+
+    Given a sequence of planets the results are arrays with one row per
+    planet.
     """
-    jd = np.atleast_1d(jd)
+    planets = (planet,) if isinstance(planet, str) else tuple(planet)
+    nplanets = len(planets)
+    jd = np.atleast_1d(jd).astype(np.float64)
+    ndays = jd.size
     vsop = VSOP87d()
-    t = jd
-    l0 = -100.0  # impossible value
+
+    # One element per (planet, day), planet major
+    rows = np.repeat(np.arange(nplanets), ndays)
+    with_earth = planets + ("Earth",)
+    jd_rows = np.tile(jd, nplanets)
+
+    t = jd_rows.copy()
+    l0 = np.full(t.shape, np.nan)  # no previous longitude yet
+    geo_l = np.empty(t.shape)
+    b = np.empty(t.shape)
+    active = np.arange(t.size)
     # We need to iterate to correct for light-time and aberration.
     # At most three passes through the loop always nails it.
     # Note that we move both the Earth and the other planet during
     #    the iteration.
+    # Each planet and day stops iterating as soon as it has converged, so
+    #    arrays give the same answers as one at a time.
     for bailout in range(20):
-        # heliocentric geometric ecliptic coordinates of the Earth
-        L0, B0, R0 = vsop.dimension3(t, "Earth")
-
-        # heliocentric geometric ecliptic coordinates of the planet
-        L, B, R = vsop.dimension3(t, planet)
+        ta = t[active]
+
+        # heliocentric geometric ecliptic coordinates of the Earth (L0, B0,
+        # R0) and the planets (L, B, R) in one call, with the Earth as one
+        # more planet.  Every planet starts with the Earth at jd.
+        earth_t = jd if bailout == 0 else ta
+        L, B, R = vsop._dimension3_rows(
+            with_earth,
+            np.concatenate((rows[active], np.full(earth_t.size, nplanets))),
+            _vsop_time_args(np.concatenate((ta, earth_t))),
+        )
+        (L, L0), (B, B0), (R, R0) = (np.split(X, [ta.size]) for X in (L, B, R))
+        if bailout == 0:
+            L0, B0, R0 = (np.tile(X, nplanets) for X in (L0, B0, R0))
 
         # rectangular offset
         cosB0 = np.cos(B0)
@@ -213,24 +383,32 @@ def geocentric_planet(jd, planet, deltaPsi, epsilon, delta):
         # geocentric geometric ecliptic coordinates of the planet
         x2 = x * x
         y2 = y * y
-        geo_l = np.arctan2(y, x)
-        b = np.arctan2(z, np.sqrt(x2 + y2))
+        la = np.atleast_1d(np.arctan2(y, x))
+        geo_l[active] = la
+        b[active] = np.arctan2(z, np.sqrt(x2 + y2))
 
         # distance to planet in AU
         dist = np.sqrt(x2 + y2 + z * z)
 
         # light time in days
-        tau = 0.0057755183 * dist
+        tau = np.atleast_1d(0.0057755183 * dist)
 
-        if abs(diff_angle(geo_l, l0)) < pi2 * delta:
+        # change in longitude since the last pass, wrapped to -pi..pi
+        change = (l0[active] - la + np.pi) % pi2 - np.pi
+        moving = ~(np.abs(change) < pi2 * delta)
+        active = active[moving]
+        if active.size == 0:
             break
 
         # adjust for light travel time and try again
-        l0 = geo_l
-        t = jd - tau
+        l0[active] = la[moving]
+        t[active] = jd_rows[active] - tau[moving]
     else:
         raise Error("bailout")
 
+    geo_l = geo_l.reshape(nplanets, ndays)
+    b = b.reshape(nplanets, ndays)
+
     # transform to FK5 ecliptic and equinox
     geo_l, b = vsop_to_fk5(jd, geo_l, b)
 
@@ -239,5 +417,86 @@ def geocentric_planet(jd, planet, deltaPsi, epsilon, delta):
 
     # equatorial coordinates
     ra, dec = ecl_to_equ(geo_l, b, epsilon)
+    ra = np.reshape(ra, (nplanets, ndays))
+    dec = np.reshape(dec, (nplanets, ndays))
+
+    if isinstance(planet, str):
+        return _scalar_if_one(ra[0]), _scalar_if_one(dec[0])
+    if ndays == 1:
+        return ra[:, 0], dec[:, 0]
+    return ra, dec
+
+
+#
+# Planet numbers for eraPlan94, which has no Earth
+#
+_erfa_planets = {
+    "Mercury": 1,
+    "Venus": 2,
+    "Mars": 4,
+    "Jupiter": 5,
+    "Saturn": 6,
+    "Uranus": 7,
+    "Neptune": 8,
+}
+
+_J2000 = 2451545.0
+
+
+def geocentric_planet_erfa(jd, planet, delta):
+    """Calculate the equatorial coordinates of a planet with ERFA.
+
+    A faster, lower precision alternative to geocentric_planet() that uses
+    the compiled eraPlan94 and eraEpv00 routines from the optional pyerfa
+    package.  eraPlan94 is good to a few arcseconds for the inner planets
+    and under an arcminute for the outer ones within 1000..3000 AD, which is
+    plenty for rise, set and transit times.
+
+    As in geocentric_planet() both the Earth and the planet are moved back
+    by the light-time, then the position is rotated to the true equator and
+    equinox of date with eraPnm06a, which brings its own nutation model.
+
+    Arguments:
+      - `jd`       : Julian Day in dynamical time
+      - `planet`   : must be one of ("Mercury", "Venus", "Mars", "Jupiter",
+        "Saturn", "Uranus", "Neptune"), or a sequence of them
+      - `delta`    : desired accuracy, in days
+
+    Returns:
+      - right accension, in radians
+      - declination, in radians
+
+    Given a sequence of planets the results are arrays with one row per
+    planet.
+    """
+    if erfa is None:
+        raise Error("geocentric_planet_erfa() needs the pyerfa package")
+    planets = (planet,) if isinstance(planet, str) else tuple(planet)
+    jd = np.atleast_1d(jd).astype(np.float64)
+    numbers = np.array([[_erfa_planets[p]] for p in planets])
+
+    # One element per (planet, day), planet major
+    t = np.tile(jd, (len(planets), 1))
+    tau = np.zeros(t.shape)
+    for _ in range(20):
+        earth, _ = erfa.epv00(_J2000, t - _J2000)
+        offset = erfa.plan94(_J2000, t - _J2000, numbers)["p"] - earth["p"]
+
+        # light time in days
+        last = tau
+        tau = 0.0057755183 * np.sqrt((offset * offset).sum(axis=-1))
+        if np.all(np.abs(tau - last) < delta):
+            break
+        t = jd - tau
+    else:
+        raise Error("bailout")
+
+    # J2000 to the true equator and equinox of date
+    ra, dec = erfa.c2s(erfa.rxp(erfa.pnm06a(_J2000, jd - _J2000), offset))
+    ra = erfa.anp(ra)
 
+    if isinstance(planet, str):
+        return _scalar_if_one(ra[0]), _scalar_if_one(dec[0])
+    if jd.size == 1:
+        return ra[:, 0], dec[:, 0]
     return ra, dec
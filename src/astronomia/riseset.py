@@ -33,12 +33,13 @@ Bug: each of the routines drops some events which occur near 0hr UT.
 
 import numpy as np
 
+from . import _kernels
 from . import globals as globls
 from .calendar import sidereal_time_greenwich
 from .constants import earth_equ_radius, pi2, seconds_per_day, standard_rst_altitude
-from .coordinates import equ_to_horiz
+from .coordinates import _latitude_sincos
 from .dynamical import deltaT_seconds
-from .util import d_to_r, diff_angle, interpolate3, interpolate_angle3, modpi2
+from .util import d_to_r
 
 
 class Error(Exception):
@@ -50,6 +51,35 @@ class Error(Exception):
 _k1 = d_to_r(360.985647)
 
 
+def _rst_result(jd, raList, m, status):
+    # Translate the status codes of a refinement kernel into Julian Days
+    if np.any(status == _kernels.RST_BAILOUT):
+        raise Error("bailout")
+    # Bug: RST_DROPPED is where we drop some events
+    td = np.where(status == _kernels.RST_CONVERGED, jd + m, np.nan)
+    if np.ndim(raList) == 2:
+        return td
+    if np.isnan(td[0]):
+        return None
+    return float(td[0])
+
+
+def _day_terms(jd, nrows):
+    # Sidereal time and deltaT in days at 0h UT for each row's day
+    jd = np.broadcast_to(np.asarray(jd, dtype=np.float64), (nrows,))
+    days, inverse = np.unique(jd, return_inverse=True)
+    deltaT = np.array([deltaT_seconds(day) for day in days.tolist()])
+    return sidereal_time_greenwich(jd), deltaT[inverse] / seconds_per_day
+
+
+def _wrap_m(m):
+    # Fold m into 0..1 and check that it got there
+    m = np.where(m < 0, m + 1, np.where(m > 1, m - 1, m))
+    if np.any(~((0 <= m) & (m <= 1)) & ~np.isnan(m)):
+        raise Error(f"m is out of range = {m}")
+    return m
+
+
 def _riseset(
     jd,
     raList,
@@ -57,137 +87,137 @@ def _riseset(
     h0,
     delta,
     mode,
-    longitude=globls.longitude,
-    latitude=globls.latitude,
+    longitude=None,
+    latitude=None,
 ):
     # Private function since rise/set so similar
 
-    THETA0 = sidereal_time_greenwich(jd)
-    deltaT_days = deltaT_seconds(jd) / seconds_per_day
-
-    cosH0 = (np.sin(h0) - np.sin(latitude) * np.sin(decList[1])) / (
-        np.cos(latitude) * np.cos(decList[1])
+    # look up the observer at call time so load_params() takes effect
+    if longitude is None:
+        longitude = globls.longitude
+    if latitude is None:
+        latitude = globls.latitude
+
+    # one row of (yesterday, today, tomorrow) per object
+    ra = np.atleast_2d(np.asarray(raList, dtype=np.float64))
+    dec = np.atleast_2d(np.asarray(decList, dtype=np.float64))
+    THETA0, deltaT_days = _day_terms(jd, ra.shape[0])
+    h0 = np.ascontiguousarray(
+        np.broadcast_to(np.asarray(h0, dtype=np.float64), ra.shape[:1])
     )
+    sinLat, cosLat = _latitude_sincos(float(latitude))
+
+    cosH0 = (np.sin(h0) - sinLat * np.sin(dec[:, 1])) / (cosLat * np.cos(dec[:, 1]))
     #
-    # future: return some indicator when the object is circumpolar or always
-    # below the horizon.
+    # future: return some indicator when the object is circumpolar
+    # (cosH0 < -1) or always below the horizon (cosH0 > 1).
     #
-    if cosH0 < -1.0:  # circumpolar
-        return None
-    if cosH0 > 1.0:  # never rises
-        return None
-
-    H0 = np.arccos(cosH0)
-    m0 = (raList[1] + longitude - THETA0) / pi2
+    # A NaN m is dropped by the kernel without iterating.
+    #
+    visible = (-1.0 <= cosH0) & (cosH0 <= 1.0)
+    H0 = np.arccos(np.where(visible, cosH0, np.nan))
+    m0 = (ra[:, 1] + longitude - THETA0) / pi2
     if mode == "rise":
         m = m0 - H0 / pi2  # the only difference between rise() and settime()
     elif mode == "set":
         m = m0 + H0 / pi2  # the only difference between rise() and settime()
-    if m < 0:
-        m += 1
-    elif m > 1:
-        m -= 1
-    if not 0 <= m <= 1:
-        raise Error(f"m is out of range = {m}")
-    for _ in range(20):
-        m0 = m
-        theta0 = modpi2(THETA0 + _k1 * m)
-        n = m + deltaT_days
-        if not -1 < n < 1:
-            return None  # Bug: this is where we drop some events
-        ra = interpolate_angle3(n, raList)
-        dec = interpolate3(n, decList)
-        H = theta0 - longitude - ra
-        H = diff_angle(0.0, H)
-        A, h = equ_to_horiz(H, dec)
-        dm = (h - h0) / (pi2 * np.cos(dec) * np.cos(latitude) * np.sin(H))
-        m += dm
-        if abs(m - m0) < delta:
-            return jd + m
-
-    raise Error("bailout")
+    m, status = _kernels.riseset_batch(
+        _wrap_m(m),
+        THETA0,
+        _k1,
+        deltaT_days,
+        ra,
+        dec,
+        h0,
+        float(delta),
+        float(longitude),
+        sinLat,
+        cosLat,
+    )
+    return _rst_result(jd, raList, m, status)
 
 
 def rise(jd, raList, decList, h0, delta):
     """Return the Julian Day of the rise time of an object.
 
     Arguments:
-      - `jd`     : (int) Julian Day number of the day in question, at 0 hr UT
+      - `jd`     : (int) Julian Day number of the day in question, at 0 hr UT,
+        or one per row
       - `raList` : (float, float, float) a sequence of three right accension
-        values, in radians, for (jd-1, jd, jd+1)
+        values, in radians, for (jd-1, jd, jd+1), or an (N, 3) array with
+        one row per object
       - `decList`: (float, float, float) a sequence of three right declination
-        values, in radians, for (jd-1, jd, jd+1)
-      - `h0`     : (float) the standard altitude in radians
+        values, in radians, for (jd-1, jd, jd+1), or an (N, 3) array
+      - `h0`     : (float) the standard altitude in radians, or one per row
       - `delta`  : (float) desired accuracy in days. Times less than one minute
         are infeasible for rise times because of atmospheric refraction.
 
     Returns:
-      - Julian Day of the rise time
+      - Julian Day of the rise time, or None if there isn't one.  For (N, 3)
+        input a length-N array with NaN in place of None.
     """
-    _riseset(jd, raList, decList, h0, delta, "rise")
+    return _riseset(jd, raList, decList, h0, delta, "rise")
 
 
 def settime(jd, raList, decList, h0, delta):
     """Return the Julian Day of the set time of an object.
 
     Arguments:
-      - `jd`      : Julian Day number of the day in question, at 0 hr UT
+      - `jd`      : Julian Day number of the day in question, at 0 hr UT, or
+        one per row
       - `raList`  : a sequence of three right accension values, in radians, for
-        (jd-1, jd, jd+1)
+        (jd-1, jd, jd+1), or an (N, 3) array with one row per object
       - `decList` : a sequence of three right declination values, in radians,
-        for (jd-1, jd, jd+1)
-      - `h0`      : the standard altitude in radians
+        for (jd-1, jd, jd+1), or an (N, 3) array
+      - `h0`      : the standard altitude in radians, or one per row
       - `delta`   : desired accuracy in days. Times less than one minute are
         infeasible for set times because of atmospheric refraction.
 
     Returns:
-      - Julian Day of the set time
+      - Julian Day of the set time, or None if there isn't one.  For (N, 3)
+        input a length-N array with NaN in place of None.
     """
-    _riseset(jd, raList, decList, h0, delta, "set")
+    return _riseset(jd, raList, decList, h0, delta, "set")
 
 
 def transit(jd, raList, delta):
     """Return the Julian Day of the transit time of an object.
 
     Arguments:
-      - `jd`      : Julian Day number of the day in question, at 0 hr UT
+      - `jd`      : Julian Day number of the day in question, at 0 hr UT, or
+        one per row
       - `raList`  : a sequence of three right accension values, in radians, for
-        (jd-1, jd, jd+1)
+        (jd-1, jd, jd+1), or an (N, 3) array with one row per object
       - `delta`   : desired accuracy in days.
 
     Returns:
-      - Julian Day of the transit time
+      - Julian Day of the transit time, or None if it was dropped.  For
+        (N, 3) input a length-N array with NaN in place of None.
     """
+    return _transit(jd, raList, delta)
+
+
+def _transit(jd, raList, delta, longitude=None):
+    # transit() with an optional observer longitude, like _riseset()
+
     #
     # future: report both upper and lower culmination, and transits of objects
     # below the horizon
     #
-    longitude = globls.longitude
-    THETA0 = sidereal_time_greenwich(jd)
-    deltaT_days = deltaT_seconds(jd) / seconds_per_day
-
-    m = (raList[1] + longitude - THETA0) / pi2
-    if m < 0:
-        m += 1
-    elif m > 1:
-        m -= 1
-    if not 0 <= m <= 1:
-        raise Error(f"m is out of range = {m}")
-    for _ in range(20):
-        m0 = m
-        theta0 = modpi2(THETA0 + _k1 * m)
-        n = m + deltaT_days
-        if not -1 < n < 1:
-            return None  # Bug: this is where we drop some events
-        ra = interpolate_angle3(n, raList)
-        H = theta0 - longitude - ra
-        H = diff_angle(0.0, H)
-        dm = -H / pi2
-        m += dm
-        if abs(m - m0) < delta:
-            return jd + m
-
-    raise Error("bailout")
+    if longitude is None:
+        longitude = globls.longitude
+    ra = np.atleast_2d(np.asarray(raList, dtype=np.float64))
+    THETA0, deltaT_days = _day_terms(jd, ra.shape[0])
+    m, status = _kernels.transit_batch(
+        _wrap_m((ra[:, 1] + longitude - THETA0) / pi2),
+        THETA0,
+        _k1,
+        deltaT_days,
+        ra,
+        float(delta),
+        float(longitude),
+    )
+    return _rst_result(jd, raList, m, status)
 
 
 def moon_rst_altitude(r):
@@ -28,6 +28,7 @@ import numpy as np
 from . import calendar
 from . import globals as globls
 from .calendar import jd_to_jcent
+from .constants import sun_rst_altitude
 from .coordinates import ecl_to_equ
 from .nutation import nutation_in_longitude, obliquity
 from .planets import VSOP87d, vsop_to_fk5
@@ -139,6 +140,28 @@ class Sun:
         R = self.dimension(jd, "R")
         return L, B, R
 
+    def apparent_equatorial(self, jd, deltaPsi, epsilon):
+        """Return apparent right ascension, declination and radius.
+
+        The VSOP87 position is corrected to FK5, for nutation in longitude
+        and for aberration, then converted to equatorial coordinates.
+
+        Arguments:
+          - `jd`       : Julian Day in dynamical time
+          - `deltaPsi` : nutation in longitude, in radians
+          - `epsilon`  : True obliquity (corrected for nutation), in radians
+
+        Returns:
+          - right ascension in radians
+          - declination in radians
+          - radius in au
+        """
+        L, B, R = self.dimension3(jd)
+        L, B = vsop_to_fk5(jd, L, B)
+        L = L + deltaPsi + aberration_low(R)
+        ra, dec = ecl_to_equ(L, B, epsilon)
+        return ra, dec, R
+
 
 #
 # Constant terms
@@ -241,8 +264,6 @@ def rise(
     latitude=globls.latitude,
     gregorian=True,
 ):
-    from .constants import sun_rst_altitude
-
     jd = calendar.cal_to_jd(year, month, day, gregorian=gregorian)
 
     sun = Sun()
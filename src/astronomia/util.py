@@ -367,8 +367,14 @@ def polynomial(terms, x):
 
             1.1 + 2.2 * t + 3.3 * t^2 + 4.4 * t^3
     """
-    apolyfunc = np.polynomial.Polynomial(terms)
-    return apolyfunc(x)
+    # Horner's rule, the same order of operations as numpy's polyval but
+    # without building a Polynomial object on every call
+    if not isinstance(x, (float, int)):
+        x = np.asarray(x, dtype=np.float64)
+    result = terms[-1] + 0.0 * x
+    for coef in terms[-2::-1]:
+        result = coef + result * x
+    return result
 
 
 #
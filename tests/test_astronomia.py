@@ -0,0 +1,129 @@
+"""
+Tests for the astronomia command line functions.
+"""
+
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+from unittest import TestCase, mock
+
+import numpy as np
+import pandas as pd
+
+from astronomia import _kernels
+from astronomia import globals as globls
+from astronomia.astronomia import _apparent_equatorial, _positions, risesettransit
+
+
+def _tsutils_stub():
+    # The toolbox_utils submodule is not always checked out; risesettransit
+    # only needs tsutils.parsedate from it.
+    try:
+        from astronomia.toolbox_utils.src.toolbox_utils import tsutils
+    except ImportError:
+        tsutils = types.ModuleType("astronomia.toolbox_utils.src.toolbox_utils.tsutils")
+        tsutils.parsedate = pd.Timestamp
+        toolbox_utils = types.ModuleType("astronomia.toolbox_utils.src.toolbox_utils")
+        toolbox_utils.tsutils = tsutils
+        src = types.ModuleType("astronomia.toolbox_utils.src")
+        src.toolbox_utils = toolbox_utils
+        package = types.ModuleType("astronomia.toolbox_utils")
+        package.src = src
+        return {
+            package.__name__: package,
+            src.__name__: src,
+            toolbox_utils.__name__: toolbox_utils,
+            tsutils.__name__: tsutils,
+        }
+    return {}
+
+
+class TestRiseSetTransit(TestCase):
+    def setUp(self):
+        # Only add and remove the stub modules; patching all of sys.modules
+        # would also drop the modules numba imports lazily during the test.
+        stub = _tsutils_stub()
+        sys.modules.update(stub)
+        for name in stub:
+            self.addCleanup(sys.modules.pop, name, None)
+
+    def test_sun_transit(self):
+        # 40 N, 75 W: the equation of time is about +2 minutes on 2020-06-01,
+        # so the Sun crosses the meridian near 16:58 UT.
+        df = risesettransit(40, -75, "2020-06-01", "2020-06-01", "sun", times="transit")
+        self.assertEqual(list(df["event"]), ["transit"])
+        expected = pd.Timestamp("2020-06-01 16:58")
+        self.assertLess(abs(df.index[0] - expected), pd.Timedelta(minutes=1))
+
+    def test_string_arguments(self):
+        # cltoolbox passes the command line arguments through as strings
+        numeric = risesettransit(40, -75, "2020-06-01", "2020-06-03", "moon")
+        string = risesettransit("40", "-75", "2020-06-01", "2020-06-03", "moon")
+        pd.testing.assert_frame_equal(numeric, string)
+
+    def test_globals_unchanged(self):
+        old = globls.longitude, globls.latitude
+        risesettransit(40, -75, "2020-06-01", "2020-06-01", "sun")
+        self.assertEqual((globls.longitude, globls.latitude), old)
+
+    def _assert_matches_single_days(self, body, start_date, end_date, times):
+        # The vectorized range must give what a day-by-day loop would
+        df = risesettransit(40, -75, start_date, end_date, body, times=times)
+        days = pd.concat(
+            risesettransit(40, -75, day, day, body, times=times)
+            for day in pd.date_range(start_date, end_date)
+        ).sort_index()
+        self.assertEqual(list(df["event"]), list(days["event"]))
+        np.testing.assert_allclose(df["jd"], days["jd"], rtol=0, atol=1e-9)
+        return df
+
+    def test_sun_range(self):
+        self._assert_matches_single_days(
+            "sun", "2020-06-01", "2020-06-10", "rise,set,transit"
+        )
+
+    def test_moon_range(self):
+        self._assert_matches_single_days(
+            "moon", "2020-06-01", "2020-06-10", "rise,set,transit"
+        )
+
+    def test_moon_day_without_event(self):
+        # The Moon does not rise on 2020-06-05 at 40 N, 75 W; the all-NaN row
+        # is dropped by stack() and the days either side must stay aligned.
+        df = self._assert_matches_single_days(
+            "moon", "2020-06-02", "2020-06-08", "rise"
+        )
+        dates = df.index.normalize()
+        self.assertEqual(len(df), 6)
+        self.assertNotIn(pd.Timestamp("2020-06-05"), dates)
+
+
+class TestPositions(TestCase):
+    def setUp(self):
+        # Force the process pool, which is only used without numba
+        for patcher in (
+            mock.patch.object(_kernels, "_have_numba", False),
+            mock.patch("os.cpu_count", return_value=2),
+            mock.patch("astronomia.astronomia._parallel_min_days", 4),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.jd = 2458999.5 + np.arange(10.0)
+
+    def _assert_pooled(self, body):
+        with mock.patch(
+            "astronomia.astronomia.ProcessPoolExecutor", wraps=ProcessPoolExecutor
+        ) as pool:
+            ra, dec = _positions(self.jd, body)
+        pool.assert_called_once()
+        expected_ra, expected_dec = _apparent_equatorial(self.jd, body)
+        # without numba, numpy's results can depend on the chunk lengths in
+        # the last bits
+        np.testing.assert_allclose(ra, expected_ra, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(dec, expected_dec, rtol=0, atol=1e-12)
+
+    def test_moon(self):
+        self._assert_pooled("moon")
+
+    def test_planet(self):
+        self._assert_pooled("mars")
@@ -0,0 +1,54 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from astronomia._cache import cache_dir, load_rst_seed, save_rst_seed
+
+
+class TestCache(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.old = os.environ.get("ASTRONOMIA_CACHE")
+        os.environ["ASTRONOMIA_CACHE"] = self.tmp.name
+        self.tables = (np.arange(6.0).reshape(2, 3), np.ones((2, 3)), np.zeros(2))
+
+    def tearDown(self):
+        if self.old is None:
+            del os.environ["ASTRONOMIA_CACHE"]
+        else:
+            os.environ["ASTRONOMIA_CACHE"] = self.old
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(load_rst_seed(2451544.5))
+        save_rst_seed(2451544.5, self.tables)
+        for got, expected in zip(load_rst_seed(2451544.5), self.tables):
+            np.testing.assert_array_equal(got, expected)
+        # another start or kind is a miss
+        self.assertIsNone(load_rst_seed(2451545.5))
+        self.assertIsNone(load_rst_seed(2451544.5, "erfa"))
+
+    def test_disabled(self):
+        os.environ["ASTRONOMIA_CACHE"] = ""
+        save_rst_seed(2451544.5, self.tables)
+        self.assertIsNone(load_rst_seed(2451544.5))
+        self.assertEqual(os.listdir(self.tmp.name), [])
+
+    def test_bad_file(self):
+        # anything that can't be read back, including pickles, is a miss
+        save_rst_seed(2451544.5, self.tables)
+        (fname,) = os.listdir(cache_dir())
+        path = os.path.join(cache_dir(), fname)
+        with open(path, "wb") as fp:
+            fp.write(b"not an archive")
+        self.assertIsNone(load_rst_seed(2451544.5))
+        with open(path, "wb") as fp:
+            np.savez(fp, np.array([None, 1.0], dtype=object))
+        self.assertIsNone(load_rst_seed(2451544.5))
+
+    def test_key(self):
+        # the directory changes with numpy's major version and the sources
+        key = os.path.basename(cache_dir())
+        self.assertIn(f"-numpy{np.__version__.split('.')[0]}-", key)
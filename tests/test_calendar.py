@@ -3,22 +3,33 @@ Tests for the elp2000 functions.
 """
 
 import math
+import os
+import time
 from unittest import TestCase
 
 import numpy as np
 
 from astronomia.calendar import (
+    _dst_transitions,
+    _month_days,
     cal_to_day_of_year,
     cal_to_jd,
     cal_to_jde,
     day_of_year_to_cal,
     easter,
+    easter_range,
     fday_to_hms,
     frac_yr_to_jd,
+    hms_to_fday,
+    is_dst,
     is_leap_year,
     jd_to_cal,
     jd_to_day_of_week,
+    jd_to_jcent,
+    lt_to_str,
     sidereal_time_greenwich,
+    split_jd,
+    to_jcent_split,
     yr_frac_mon_to_jd,
 )
 from astronomia.coordinates import ecl_to_equ
@@ -56,6 +67,12 @@ class TestUtil(TestCase):
         self.assertRaises(ValueError, cal_to_jd, 1991, 12, 32)
         self.assertRaises(ValueError, cal_to_jd, 1991.1, 12.1)
 
+    def test_cal_to_jd_array(self):
+        jd = cal_to_jd(2000, [1, 2, 3, 12], [1, 29, 1, 30.5])
+        for ajd, mon, day in zip(jd, [1, 2, 3, 12], [1, 29, 1, 30.5]):
+            self.assertEqual(ajd, cal_to_jd(2000, mon, day))
+        np.testing.assert_array_equal(jd, [2451544.5, 2451603.5, 2451604.5, 2451909.0])
+
     def test_fday_to_hms(self):
         self.assertEqual(fday_to_hms(0.5), (12, 0, 0))
         self.assertEqual(fday_to_hms(0.5006944444444444445), (12, 1, 0))
@@ -68,6 +85,9 @@ class TestUtil(TestCase):
         self.assertEqual(jd, 2434923.5)
         dow = jd_to_day_of_week(jd)
         self.assertEqual(dow, 3)
+        # a week of 0h UT Julian days, 1954-06-27 (Sunday) onwards
+        dow = jd_to_day_of_week(jd - 3 + np.arange(7))
+        np.testing.assert_array_equal(dow, np.arange(7))
 
     def test_sidereal(self):
         N = sidereal_time_greenwich(cal_to_jd(2004, 1, 1))
@@ -76,6 +96,8 @@ class TestUtil(TestCase):
         N = sidereal_time_greenwich(cal_to_jd(2004, 1, [1, 2]))
         testval1 = (6 * 3600 + 43 * 60 + 55.15832794114431) / 43200 * math.pi
         np.testing.assert_array_almost_equal(N, [testval, testval1], decimal=4)
+        N = sidereal_time_greenwich([2453005.5, 2453006.5])
+        np.testing.assert_array_almost_equal(N, [testval, testval1], decimal=4)
 
     def test_doy(self):
         N = cal_to_day_of_year(1978, 11, 14)
@@ -120,6 +142,22 @@ class TestUtil(TestCase):
         self.assertAlmostEqual(r_to_d(ra), 116.328942, places=5)
         self.assertAlmostEqual(r_to_d(dec), 28.026183, places=6)
 
+    def test_cal_to_jd_scalar(self):
+        # the scalar fast path has to agree with the array code
+        for date in ((1957, 10, 4.81), (2000, 2, 29), (-584, 5, 28.63), (1582, 1, 1)):
+            for gregorian in (True, False):
+                self.assertEqual(
+                    cal_to_jd(*date, gregorian=gregorian),
+                    cal_to_jd(*[np.array([i]) for i in date], gregorian=gregorian),
+                )
+        for date in ((1900, 2, 29), (2001, 4, 31), (2000, 13, 1), (2000.5, 1, 1)):
+            with self.assertRaises(ValueError):
+                cal_to_jd(*date)
+
+    def test_month_days(self):
+        for mon in range(3, 15):
+            self.assertEqual(_month_days[mon - 3], int(30.6001 * (mon + 1)))
+
     def test_easter(self):
         tbl = (
             (1991, 3, 31),
@@ -140,6 +178,13 @@ class TestUtil(TestCase):
             self.assertEqual(mo, 4)
             self.assertEqual(day, 12)
 
+    def test_easter_range(self):
+        for gregorian in (True, False):
+            mon, day = easter_range(1900, 2100, gregorian)
+            self.assertEqual(len(mon), 201)
+            for year, xmo, xday in zip(range(1900, 2101), mon, day):
+                self.assertEqual((xmo, xday), easter(year, gregorian))
+
     def test_cal_to_jde(self):
         tbl = [
             [(2013, 6, 18, 18, 25, 30), 2456462.267708],
@@ -149,6 +194,62 @@ class TestUtil(TestCase):
             jd = cal_to_jde(*date)
             np.testing.assert_array_almost_equal(jd, testval, decimal=6)
 
+    def test_split_jd(self):
+        jd = np.array([2453005.5, 2453006.75])
+        split = split_jd(jd)
+        np.testing.assert_array_equal(split.day, [2453005.0, 2453006.0])
+        np.testing.assert_array_equal(split.frac, [0.5, 0.75])
+        np.testing.assert_array_almost_equal(
+            to_jcent_split(*split), jd_to_jcent(jd), decimal=12
+        )
+        np.testing.assert_array_almost_equal(
+            sidereal_time_greenwich(split), sidereal_time_greenwich(jd), decimal=9
+        )
+
+    def test_lt_to_str(self):
+        jd = cal_to_jd(2013, 6, 18) + hms_to_fday(18, 25, 30.5)
+        self.assertEqual(lt_to_str(jd, "EDT"), "2013-jun-18 18:25:30 EDT")
+        self.assertEqual(lt_to_str(jd, "EDT", "minute"), "2013-jun-18 18:25 EDT")
+        self.assertEqual(lt_to_str(jd, "EDT", "hour"), "2013-jun-18 18 EDT")
+        self.assertEqual(lt_to_str(jd, "EDT", "day"), "2013-jun-18")
+
+    def test_jd_to_jcent(self):
+        self.assertEqual(jd_to_jcent(2451545.0), 0.0)
+        self.assertAlmostEqual(jd_to_jcent(2448908.5), -0.072183436)
+        np.testing.assert_array_almost_equal(
+            jd_to_jcent([2451545.0, 2488070.0]), [0.0, 1.0]
+        )
+
     def test_is_leap_year(self):
         self.assertEqual(is_leap_year(2004), True)
         self.assertEqual(is_leap_year(2004, gregorian=False), True)
+        self.assertEqual(is_leap_year(1900), False)
+        self.assertEqual(is_leap_year(1900, gregorian=False), True)
+        self.assertEqual(is_leap_year(2000), True)
+        self.assertEqual(is_leap_year(-4), True)
+        np.testing.assert_array_equal(
+            is_leap_year([1900, 1999, 2000, 2004]), [False, False, True, True]
+        )
+
+    def test_is_dst(self):
+        old_tz = os.environ.get("TZ")
+        os.environ["TZ"] = "EST5EDT,M3.2.0,M11.1.0"
+        time.tzset()
+        _dst_transitions.cache_clear()
+        try:
+            self.assertFalse(is_dst(cal_to_jd(2020, 1, 15)))
+            self.assertTrue(is_dst(cal_to_jd(2020, 7, 1)))
+            self.assertFalse(is_dst(cal_to_jd(2020, 12, 1)))
+            # DST starts 2020-03-08 at 2AM EST, which is 7h UT
+            self.assertFalse(is_dst(cal_to_jd(2020, 3, 8) + 6.99 / 24))
+            self.assertTrue(is_dst(cal_to_jd(2020, 3, 8) + 7.01 / 24))
+            # arrays match day by day, across several years
+            jd = cal_to_jd(2019, 12, 1) + np.arange(0.0, 500.0, 0.37)
+            np.testing.assert_array_equal(is_dst(jd), [is_dst(i) for i in jd])
+        finally:
+            if old_tz is None:
+                del os.environ["TZ"]
+            else:
+                os.environ["TZ"] = old_tz
+            time.tzset()
+            _dst_transitions.cache_clear()
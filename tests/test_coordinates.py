@@ -1,7 +1,10 @@
 from unittest import TestCase
 
-from astronomia.coordinates import ecl_to_equ, ell_to_geo, equ_to_ecl
-from astronomia.util import d_to_r, modpi2, r_to_d
+import numpy as np
+
+from astronomia import globals as globls
+from astronomia.coordinates import ecl_to_equ, ell_to_geo, equ_to_ecl, equ_to_horiz
+from astronomia.util import d_to_r, dms_to_d, modpi2, r_to_d
 
 
 class TestCoords(TestCase):
@@ -18,6 +21,25 @@ class TestCoords(TestCase):
         self.assertAlmostEqual(r_to_d(ra), 116.328942, places=5)
         self.assertAlmostEqual(r_to_d(dec), 28.026183, places=6)
 
+    def test_ecl_to_equ_array(self):
+        ra, dec = ecl_to_equ(
+            d_to_r(np.array([113.215630, 113.215630])),
+            d_to_r(6.684170),
+            d_to_r(23.4392911),
+        )
+        np.testing.assert_array_almost_equal(r_to_d(ra), [116.328942] * 2, decimal=5)
+        np.testing.assert_array_almost_equal(r_to_d(dec), [28.026183] * 2, decimal=6)
+
+    def test_equ_to_horiz(self):
+        old_latitude = globls.latitude
+        globls.latitude = d_to_r(dms_to_d(38, 55, 17))
+        try:
+            A, h = equ_to_horiz(d_to_r(64.352133), d_to_r(-6.719892))
+        finally:
+            globls.latitude = old_latitude
+        self.assertAlmostEqual(r_to_d(A), 68.0337, places=4)
+        self.assertAlmostEqual(r_to_d(h), 15.1249, places=4)
+
     def test_ell_to_geo(self):
         phi, theta, r = ell_to_geo(d_to_r(0), d_to_r(0), 10000)
         self.assertAlmostEqual(r_to_d(modpi2(phi)), 203.23542197)
@@ -0,0 +1,85 @@
+"""
+Tests for the cronus application.
+"""
+
+import contextlib
+import io
+import os
+import time
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+import astronomia
+from astronomia import globals as globls
+from astronomia.apps import cronus
+from astronomia.calendar import _dst_transitions
+
+
+class TestCronus(TestCase):
+    # The whole of 2000, as it comes out with US Eastern time and the rules
+    # for daylight saving time in force that year
+    @classmethod
+    def setUpClass(cls):
+        environ = {
+            "TZ": "EST5EDT,M4.1.0,M10.5.0",
+            "ASTRONOMIA_CACHE": "",
+            "ASTRONOMIA_PARAMS": os.path.join(
+                os.path.dirname(astronomia.__file__), "astronomia_params.txt"
+            ),
+            "ASTRONOMIA_PLANETS": "",
+        }
+        old_environ = {name: os.environ.get(name) for name in environ}
+        old_globals = dict(vars(globls))
+        os.environ.update(environ)
+        time.tzset()
+        # the DST transitions are cached by year for the time zone in use
+        _dst_transitions.cache_clear()
+        try:
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                cronus.cronus(2000, 2000)
+        finally:
+            for name, value in old_environ.items():
+                if value is None:
+                    del os.environ[name]
+                else:
+                    os.environ[name] = value
+            time.tzset()
+            _dst_transitions.cache_clear()
+            vars(globls).update(old_globals)
+        cls.lines = out.getvalue().splitlines()
+
+    def test_count(self):
+        self.assertEqual(len(self.lines), 9860)
+
+    def test_known_lines(self):
+        for line in (
+            "2000-apr-23              Easter",
+            "2000-mar-20 02:35:15 EST Vernal Equinox",
+            "2000-jun-20 21:47:42 EDT Summer Solstice",
+            "2000-sep-22 13:27:35 EDT Autumnal Equinox",
+            "2000-dec-21 08:37:25 EST Winter Solstice",
+            "2000-jan-01 08:38   EST Sun rises",
+            "2000-jan-01 13:09:12 EST Sun transits",
+        ):
+            self.assertIn(line, self.lines)
+
+    def test_order(self):
+        # Universal times of the event lines never go backwards by more than
+        # the minute that rises and sets are rounded to
+        offsets = {"EST": 5, "EDT": 4}
+        previous = datetime(1999, 1, 1)
+        for line in self.lines:
+            if line.startswith("*"):
+                continue
+            fields = line.split()
+            if len(fields) == 2:
+                # Easter is queued at 0h UT of its day
+                when = datetime.strptime(fields[0], "%Y-%b-%d")
+            else:
+                stamp = " ".join(fields[:2])
+                fmt = "%Y-%b-%d %H:%M:%S" if stamp.count(":") == 2 else "%Y-%b-%d %H:%M"
+                when = datetime.strptime(stamp, fmt)
+                when += timedelta(hours=offsets[fields[2]])
+            self.assertGreaterEqual(when, previous - timedelta(minutes=1), line)
+            previous = max(previous, when)
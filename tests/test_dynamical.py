@@ -7,7 +7,8 @@ from unittest import TestCase
 import numpy as np
 
 from astronomia.calendar import cal_to_jd
-from astronomia.dynamical import deltaT_seconds
+from astronomia.constants import seconds_per_day
+from astronomia.dynamical import deltaT_seconds, dt_to_ut
 
 
 class TestDynamical(TestCase):
@@ -57,3 +58,11 @@ class TestDynamical(TestCase):
         ]:
             secs = deltaT_seconds(jd)
             np.testing.assert_array_almost_equal(secs, testsec, decimal=1)
+
+    def test_dt_to_ut(self):
+        # the minute cache must stay within a millisecond of the direct value
+        for jd in [cal_to_jd(1977, 1, 18.4321), cal_to_jd(2150, 1, 1.9876)]:
+            expected = jd - deltaT_seconds(jd) / seconds_per_day
+            self.assertAlmostEqual(
+                (dt_to_ut(jd) - expected) * seconds_per_day, 0.0, places=3
+            )
@@ -76,6 +76,11 @@ class TestELP(TestCase):
             calc_radius, [_comp_radius, 357206], decimal=1
         )
 
+    def test_dimension3_2d(self):
+        jd = np.linspace(2448724.5, 2456466.5, 6)
+        for flat, grid in zip(_elp.dimension3(jd), _elp.dimension3(jd.reshape(2, 3))):
+            np.testing.assert_array_equal(grid, flat.reshape(2, 3))
+
     def test_compare_to_schureman(self):
         rad2deg = 180.0 / np.pi
         dt = [datetime.datetime(i, 1, 1) for i in range(1800, 2001, 20)]
@@ -125,6 +125,17 @@ class TestEquinox(TestCase):
                     jd, cal_to_jd(yr, _months[season], day + fday), decimal=4
                 )
 
+    def test_equinox_array(self):
+        years = np.array([1996, 1997, 2005])
+        approx = equinox_approx(years, "winter")
+        np.testing.assert_array_equal(
+            approx, [equinox_approx(yr, "winter") for yr in years]
+        )
+        jd = equinox(approx, "winter", days_per_second)
+        np.testing.assert_array_almost_equal(
+            jd, [equinox(i, "winter", days_per_second) for i in approx], decimal=5
+        )
+
     def test_equinox_range(self):
         """
         Check the accuracy of the equinox approximation routines over
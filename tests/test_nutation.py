@@ -4,9 +4,20 @@ Tests for the elp2000 functions.
 
 from unittest import TestCase
 
+import numpy as np
+
+from astronomia import _kernels
 from astronomia.nutation import (
+    _args,
+    _eps_coefs,
+    _nutation_and_obliquity,
+    _psi_coefs,
+    clear_cache,
+    nutation,
+    nutation_and_obliquity,
     nutation_in_longitude,
     nutation_in_obliquity,
+    nutation_low,
     obliquity,
     obliquity_hi,
 )
@@ -35,6 +46,11 @@ class TestNutation(TestCase):
         self.assertEqual(m, 0)
         self.assertAlmostEqual(s, 9.443, places=3)
 
+    def test_nutation_low(self):
+        deltaPsi, deltaEps = nutation_low(2446895.5)
+        self.assertAlmostEqual(r_to_d(deltaPsi) * 3600, -3.788, delta=0.5)
+        self.assertAlmostEqual(r_to_d(deltaEps) * 3600, 9.443, delta=0.1)
+
     def test_obliquity(self):
         eps = obliquity(2446895.5)
         d, m, s = d_to_dms(r_to_d(eps))
@@ -48,3 +64,40 @@ class TestNutation(TestCase):
         self.assertEqual(d, 23)
         self.assertEqual(m, 26)
         self.assertAlmostEqual(s, 27.407, places=3)
+
+    def test_nutation_and_obliquity(self):
+        clear_cache()
+        deltaPsi, eps = nutation_and_obliquity(2446895.5)
+        self.assertAlmostEqual(deltaPsi, nutation_in_longitude(2446895.5), places=12)
+        self.assertAlmostEqual(
+            eps,
+            obliquity(2446895.5) + nutation_in_obliquity(2446895.5),
+            places=12,
+        )
+        deltaPsi, eps = nutation_and_obliquity([2446894.5, 2446895.5])
+        self.assertEqual(len(deltaPsi), 2)
+        self.assertAlmostEqual(deltaPsi[1], nutation_in_longitude(2446895.5))
+
+    def test_nutation_and_obliquity_window_reuse(self):
+        # consecutive yesterday/today/tomorrow windows share two days
+        clear_cache()
+        nutation_and_obliquity([2446894.5, 2446895.5, 2446896.5])
+        nutation_and_obliquity([2446895.5, 2446896.5, 2446897.5])
+        info = _nutation_and_obliquity.cache_info()
+        self.assertEqual(info.hits, 2)
+        self.assertEqual(info.misses, 4)
+
+    def test_nutation(self):
+        for jd in (2446895.5, [2446895.5, 2456479.5]):
+            deltaPsi, deltaEps = nutation(jd)
+            np.testing.assert_allclose(deltaPsi, nutation_in_longitude(jd), atol=1e-18)
+            np.testing.assert_allclose(deltaEps, nutation_in_obliquity(jd), atol=1e-18)
+
+    def test_sincos_series_loop_matches_numpy(self):
+        angles = np.linspace(0, 6, 15).reshape(5, 3)
+        loop = _kernels._sincos_series_loop(_args, _psi_coefs, _eps_coefs, angles)
+        vectorized = _kernels._sincos_series_numpy(
+            _args, _psi_coefs, _eps_coefs, angles
+        )
+        for a, b in zip(loop, vectorized):
+            np.testing.assert_allclose(a, b, rtol=1e-12, atol=1e-12)
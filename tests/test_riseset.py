@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+import numpy as np
+
+from astronomia import globals as globls
+from astronomia.calendar import cal_to_jd
+from astronomia.riseset import rise, settime, transit
+from astronomia.util import d_to_r
+
+
+class TestRiseSet(TestCase):
+    # [Meeus-1998: example 15.a], Venus at Boston on 1988 March 20
+    def setUp(self):
+        self.old = globls.longitude, globls.latitude
+        globls.longitude = d_to_r(71.0833)
+        globls.latitude = d_to_r(42.3333)
+        self.jd = cal_to_jd(1988, 3, 20)
+        self.raList = [d_to_r(40.68021), d_to_r(41.73129), d_to_r(42.78204)]
+        self.decList = [d_to_r(18.04761), d_to_r(18.44092), d_to_r(18.82742)]
+
+    def tearDown(self):
+        globls.longitude, globls.latitude = self.old
+
+    def test_rise(self):
+        jd = rise(self.jd, self.raList, self.decList, d_to_r(-0.5667), 0.0001)
+        self.assertAlmostEqual(jd - self.jd, 0.51766, places=4)
+
+    def test_settime(self):
+        jd = settime(self.jd, self.raList, self.decList, d_to_r(-0.5667), 0.0001)
+        self.assertAlmostEqual(jd - self.jd, 0.12130, places=4)
+
+    def test_transit(self):
+        jd = transit(self.jd, self.raList, 0.0001)
+        self.assertAlmostEqual(jd - self.jd, 0.81980, places=4)
+
+    def test_batch(self):
+        # one row per object, the second is the first shifted by a day
+        raList = np.array([self.raList, [ra + 0.0175 for ra in self.raList]])
+        decList = np.array([self.decList, self.decList])
+        h0 = d_to_r(-0.5667)
+        rises = rise(self.jd, raList, decList, h0, 0.0001)
+        transits = transit(self.jd, raList, 0.0001)
+        self.assertEqual(rises.shape, (2,))
+        self.assertAlmostEqual(rises[0] - self.jd, 0.51766, places=4)
+        self.assertAlmostEqual(
+            rises[1], rise(self.jd, raList[1], decList[1], h0, 0.0001)
+        )
+        self.assertAlmostEqual(transits[0] - self.jd, 0.81980, places=4)
+
+    def test_never_rises(self):
+        decList = [d_to_r(-60.0)] * 3
+        self.assertIsNone(rise(self.jd, self.raList, decList, 0.0, 0.0001))
+        self.assertTrue(
+            np.isnan(rise(self.jd, [self.raList], [decList], 0.0, 0.0001)[0])
+        )
+
+    def test_batch_days(self):
+        # one day per row
+        raList = np.array([self.raList, self.raList])
+        decList = np.array([self.decList, self.decList])
+        days = np.array([self.jd, self.jd + 1])
+        sets = settime(days, raList, decList, d_to_r(-0.5667), 0.0001)
+        for day, td in zip(days, sets):
+            self.assertEqual(
+                td, settime(day, self.raList, self.decList, d_to_r(-0.5667), 0.0001)
+            )
@@ -9,6 +9,11 @@ import numpy as np
 
 from astronomia.calendar import cal_to_jd, hms_to_fday
 from astronomia.constants import km_per_au
+from astronomia.nutation import (
+    nutation_in_longitude,
+    nutation_in_obliquity,
+    obliquity,
+)
 from astronomia.planets import VSOP87d, vsop_to_fk5
 from astronomia.sun import (
     Sun,
@@ -58,6 +63,16 @@ class TestSun(TestCase):
         )
         np.testing.assert_array_almost_equal(R, 0.99760853)
 
+    def test_apparent_equatorial(self):
+        # [Meeus-1998: example 25.b]
+        jd = 2448908.5
+        deltaPsi = nutation_in_longitude(jd)
+        eps = obliquity(jd) + nutation_in_obliquity(jd)
+        ra, dec, R = sun.apparent_equatorial(jd, deltaPsi, eps)
+        self.assertAlmostEqual(r_to_d(ra), 198.378121, places=5)
+        self.assertAlmostEqual(r_to_d(dec), -7.783817, places=5)
+        self.assertAlmostEqual(R, 0.99760853, places=7)
+
     def test_compare_to_schureman(self):
         rad2deg = 180.0 / np.pi
         dt = [datetime.datetime(i, 1, 1) for i in range(1800, 2001, 20)]
@@ -3,13 +3,19 @@ Tests for the elp2000 functions.
 """
 
 import os.path
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
 import numpy as np
 
 from astronomia.calendar import hms_to_fday
 from astronomia.constants import days_per_second, km_per_au, pi2
-from astronomia.planets import VSOP87d, geocentric_planet
+from astronomia.planets import (
+    VSOP87d,
+    erfa,
+    geocentric_planet,
+    geocentric_planet_erfa,
+    vsop_to_fk5,
+)
 from astronomia.util import d_to_r, dms_to_d, r_to_d
 
 vsop = VSOP87d()
@@ -28,6 +34,25 @@ class TestVSOP(TestCase):
             R * km_per_au, 0.724603 * km_per_au, decimal=-4
         )
 
+    def test_dimension3_array(self):
+        jd = np.array([2448976.5, 2448977.5])
+        L, B, R = vsop.dimension3(jd, "Venus")
+        for i, ajd in enumerate(jd):
+            L1, B1, R1 = vsop.dimension3(ajd, "Venus")
+            np.testing.assert_array_almost_equal(L[i], L1)
+            np.testing.assert_array_almost_equal(B[i], B1)
+            np.testing.assert_array_almost_equal(R[i], R1)
+
+    def test_dimension3_all(self):
+        jd = np.array([2448976.5, 2448977.5])
+        L, B, R = vsop.dimension3_all(jd, ("Venus", "Mars"))
+        self.assertEqual(L.shape, (2, 2))
+        for i, planet in enumerate(("Venus", "Mars")):
+            L1, B1, R1 = vsop.dimension3(jd, planet)
+            np.testing.assert_array_almost_equal(L[i], L1)
+            np.testing.assert_array_almost_equal(B[i], B1)
+            np.testing.assert_array_almost_equal(R[i], R1)
+
     def test_geocentric_planet(self):
         ra, dec = geocentric_planet(
             2448976.5,
@@ -41,8 +66,47 @@ class TestVSOP(TestCase):
         )
         np.testing.assert_almost_equal(r_to_d(dec), dms_to_d(-18, 53, 16.84), decimal=5)
 
+    def test_geocentric_planet_list(self):
+        args = (2448976.5, d_to_r(16.749 / 3600), d_to_r(23.439669), days_per_second)
+        ra, dec = geocentric_planet(args[0], ["Venus", "Mars"], *args[1:])
+        self.assertEqual(ra.shape, (2,))
+        for i, planet in enumerate(("Venus", "Mars")):
+            ra1, dec1 = geocentric_planet(args[0], planet, *args[1:])
+            self.assertAlmostEqual(ra[i], ra1, places=12)
+            self.assertAlmostEqual(dec[i], dec1, places=12)
+
+    @skipUnless(erfa, "needs pyerfa")
+    def test_geocentric_planet_erfa(self):
+        # [Meeus-1998: example 33.a] to within the precision of eraPlan94
+        ra, dec = geocentric_planet_erfa(2448976.5, "Venus", days_per_second)
+        np.testing.assert_array_almost_equal(
+            r_to_d(ra), r_to_d(hms_to_fday(21, 4, 41.454) * pi2), decimal=3
+        )
+        np.testing.assert_almost_equal(r_to_d(dec), dms_to_d(-18, 53, 16.84), decimal=3)
+
 
 class TestVSOPDatabase(TestCase):
+    def test_vsop_to_fk5_scalar(self):
+        jd = np.array([2448976.5, 2451545.0])
+        L, B = vsop.dimension3(jd, "Venus")[:2]
+        L5, B5 = vsop_to_fk5(jd, L, B)
+        for i in range(2):
+            self.assertEqual(vsop_to_fk5(jd[i], L[i], B[i]), (L5[i], B5[i]))
+
+    def test_tables_match_dict(self):
+        # the .npy tables have to be rebuilt whenever vsop87d_dict.py changes
+        from astronomia.planets import _load_planets
+        from astronomia.vsop87d_dict import _planets as terms
+
+        _planets = _load_planets()
+
+        for key, series in terms.items():
+            self.assertEqual(len(_planets[key]), len(series))
+            for got, expected in zip(_planets[key], series):
+                np.testing.assert_array_equal(
+                    np.array(got).T, np.array(expected).reshape(-1, 3)
+                )
+
     def test_vsop87d_chk(self):
         """
         where "vsop87.chk" has been fetched from the ftp directory referenced